@@ -0,0 +1,219 @@
+import string
+from math import isqrt
+
+import numpy as np
+
+from benchmarks.harness import Case
+from loader import load_solution
+
+LETTERS = string.ascii_lowercase
+
+trie_208 = load_solution(208)
+anagrams_49 = load_solution(49)
+cards_2260 = load_solution(2260)
+digits_2342 = load_solution(2342)
+pairs_2352 = load_solution(2352)
+ransom_383 = load_solution(383)
+jewels_771 = load_solution(771)
+
+
+def random_word(rng, shortest=3, longest=10):
+    return "".join(rng.choices(LETTERS, k=rng.randint(shortest, longest)))
+
+
+# ---------------------------------------------------------------------
+# Input generators: 'size' is the number of input elements
+# (characters, words, cards, numbers or grid cells).
+# ---------------------------------------------------------------------
+def trie_input(size, rng):
+    words = []
+    total = 0
+    while total < size:
+        words.append(random_word(rng))
+        total += len(words[-1])
+    queries = [
+        rng.choice(words) if i % 2 else random_word(rng) for i in range(len(words))
+    ]
+    return words, queries
+
+
+def autocomplete_input(size, rng):
+    """A weighted Trie of 'size' words and 1000 one- to three-letter prefixes."""
+    trie = trie_208.Trie()
+    for _ in range(size):
+        trie.insert(random_word(rng), rng.randint(1, 1000))
+    prefixes = [random_word(rng, 1, 3) for _ in range(1000)]
+    return trie, prefixes
+
+
+def scan_input(size, rng):
+    """A text of 'size' letters and a 1000 word dictionary over "abcd"."""
+    words = ["".join(rng.choices("abcd", k=rng.randint(2, 8))) for _ in range(1000)]
+    automaton = trie_208.AhoCorasick.from_words(words)
+    text = "".join(rng.choices("abcd", k=size))
+    return automaton, text
+
+
+def anagrams_input(size, rng):
+    roots = [random_word(rng, 2, 8) for _ in range(max(1, size // 4))]
+    strs = []
+    for _ in range(size):
+        letters = list(rng.choice(roots))
+        rng.shuffle(letters)
+        strs.append("".join(letters))
+    return (strs,)
+
+
+def cards_input(size, rng):
+    """
+    No two neighbouring cards are equal, so a pair of adjacent cards never
+    ends minimumCardPickup early and every card is read.
+    """
+    cards = []
+    for _ in range(size):
+        card = rng.randrange(size)
+        if cards and card == cards[-1]:
+            card = (card + 1) % max(2, size)
+        cards.append(card)
+    return (cards,)
+
+
+def cards_array_input(size, rng):
+    return (np.array(cards_input(size, rng)[0], dtype=np.int64),)
+
+
+def digit_sum_input(size, rng):
+    return ([rng.randint(1, 10**9) for _ in range(size)],)
+
+
+def digit_sum_array_input(size, rng):
+    return (np.array(digit_sum_input(size, rng)[0], dtype=np.int64),)
+
+
+def grid_input(size, rng):
+    """A symmetric grid, so every row has at least one equal column."""
+    n = max(1, isqrt(size))
+    grid = [[0] * n for _ in range(n)]
+    for r in range(n):
+        for c in range(r, n):
+            grid[r][c] = grid[c][r] = rng.randint(1, 3)
+    return (grid,)
+
+
+def grid_array_input(size, rng):
+    return (np.array(grid_input(size, rng)[0], dtype=np.int64),)
+
+
+def ransom_input(size, rng):
+    """A note that can be built, so the whole note is checked."""
+    magazine = "".join(rng.choices(LETTERS, k=size))
+    note = "".join(rng.sample(magazine, max(1, size // 2)))
+    return note, magazine
+
+
+def jewels_input(size, rng):
+    jewels = "".join(rng.sample(string.ascii_letters, 10))
+    stones = "".join(rng.choices(string.ascii_letters, k=size))
+    return jewels, stones
+
+
+# ---------------------------------------------------------------------
+# Runners
+# ---------------------------------------------------------------------
+def run_trie(words, queries):
+    trie = trie_208.Trie()
+    for word in words:
+        trie.insert(word)
+    for query in queries:
+        trie.search(query)
+        trie.startsWith(query[:3])
+
+
+def run_compact_trie(words, queries):
+    trie = trie_208.CompactTrie()
+    for word in words:
+        trie.insert(word)
+    for query in queries:
+        trie.search(query)
+        trie.startsWith(query[:3])
+
+
+def run_radix_trie(words, queries):
+    trie = trie_208.RadixTrie()
+    for word in words:
+        trie.insert(word)
+    for query in queries:
+        trie.search(query)
+        trie.startsWith(query[:3])
+
+
+def run_autocomplete(trie, prefixes):
+    for prefix in prefixes:
+        trie.count_prefix(prefix)
+        trie.top_k(prefix, 10)
+
+
+def run_aho_corasick(automaton, text):
+    return sum(1 for _ in automaton.scan(text))
+
+
+def run_naive_scan(automaton, text):
+    """Walk the trie from every offset, the per-offset startsWith approach."""
+    matches = 0
+    for start in range(len(text)):
+        current = automaton.root
+        for i in range(start, len(text)):
+            current = current.children.get(text[i])
+            if current is None:
+                break
+            matches += current.is_end_of_word
+    return matches
+
+
+def run_card_pickup(cards):
+    """The dict scan; an iterator is never dispatched to the NumPy path."""
+    return cards_2260.Solution().minimumCardPickup(iter(cards))
+
+
+def run_can_construct_bytes(note, magazine):
+    return ransom_383.MagazineIndex(magazine).can_construct(note)
+
+
+def run_compact_trie_bulk_load(words, queries):
+    trie = trie_208.CompactTrie()
+    trie.bulk_load(sorted(words))
+
+
+CASES = [
+    Case("208.Trie", trie_input, run_trie, max_size=10**6),
+    Case("208.CompactTrie", trie_input, run_compact_trie, max_size=10**6),
+    Case(
+        "208.CompactTrie.bulk_load",
+        trie_input,
+        run_compact_trie_bulk_load,
+        max_size=10**6,
+    ),
+    Case("208.RadixTrie", trie_input, run_radix_trie, max_size=10**6),
+    Case("208.Trie.top_k", autocomplete_input, run_autocomplete, max_size=10**6),
+    Case("208.AhoCorasick.scan", scan_input, run_aho_corasick),
+    Case("208.naive_scan", scan_input, run_naive_scan),
+    Case("49.groupAnagrams", anagrams_input, anagrams_49.Solution().groupAnagrams),
+    Case("2260.minimumCardPickup", cards_input, run_card_pickup),
+    Case(
+        "2260.minimumCardPickup[numpy]",
+        cards_array_input,
+        cards_2260.minimum_card_pickup_array,
+    ),
+    Case("2342.maximumSum", digit_sum_input, digits_2342.Solution().maximumSum),
+    Case(
+        "2342.maximumSum[numpy]",
+        digit_sum_array_input,
+        digits_2342.Solution().maximumSum,
+    ),
+    Case("2352.equalPairs", grid_input, pairs_2352.Solution().equalPairs),
+    Case("2352.equalPairs[numpy]", grid_array_input, pairs_2352.Solution().equalPairs),
+    Case("383.canConstruct", ransom_input, ransom_383.can_construct_counter),
+    Case("383.canConstruct[bytes]", ransom_input, run_can_construct_bytes),
+    Case("771.numJewelsInStones", jewels_input, jewels_771.count_jewels_set),
+    Case("771.numJewelsInStones[bytes]", jewels_input, jewels_771.count_jewels_bytes),
+]
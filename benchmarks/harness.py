@@ -0,0 +1,140 @@
+import json
+import math
+import platform
+import random
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class Case:
+    """
+    One benchmarked function. 'make_input(size, rng)' returns the argument
+    tuple for 'run', and is not part of the timing. Sizes above 'max_size'
+    are skipped for cases that would not fit in memory.
+    """
+
+    name: str
+    make_input: Callable[[int, random.Random], tuple]
+    run: Callable[..., Any]
+    max_size: int = 10**7
+
+
+def log_sizes(min_size, max_size, per_decade=1):
+    """Log-spaced sizes from min_size to max_size, inclusive."""
+    start = math.log10(min_size)
+    stop = math.log10(max_size)
+    steps = max(1, round((stop - start) * per_decade))
+    sizes = [
+        round(10 ** (start + (stop - start) * i / steps)) for i in range(steps + 1)
+    ]
+    return sorted(set(sizes))
+
+
+def time_case(case, sizes, repeats=5, warmup=1, seed=0):
+    """
+    Time 'case' at each size. Inputs are generated from a seed derived from
+    'seed', the case name and the size, so runs are reproducible.
+    """
+    timings = {"sizes": [], "median": [], "min": []}
+    for size in sizes:
+        if size > case.max_size:
+            continue
+        rng = random.Random(f"{seed}:{case.name}:{size}")
+        args = case.make_input(size, rng)
+
+        for _ in range(warmup):
+            case.run(*args)
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            case.run(*args)
+            samples.append(time.perf_counter() - start)
+
+        timings["sizes"].append(size)
+        timings["median"].append(statistics.median(samples))
+        timings["min"].append(min(samples))
+        print(f"  {case.name:<32} n={size:<10} {timings['median'][-1]:.6f}s")
+
+    timings["exponent"] = fit_exponent(timings["sizes"], timings["median"])
+    return timings
+
+
+def fit_exponent(sizes, seconds):
+    """
+    Least-squares slope of log(time) against log(size), i.e. the k in
+    time ~ size**k. Returns None with fewer than two usable points.
+    """
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run_cases(cases, sizes, repeats=5, warmup=1, seed=0):
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeats": repeats,
+            "warmup": warmup,
+            "seed": seed,
+        },
+        "cases": {},
+    }
+    for case in cases:
+        print(case.name)
+        results["cases"][case.name] = time_case(case, sizes, repeats, warmup, seed)
+    return results
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Compare median times against a baseline run. Returns a list of
+    (case, size, ratio) for every point that got slower by more than
+    'threshold' (0.1 means 10%).
+    """
+    regressions = []
+    for name, current in results["cases"].items():
+        previous = baseline["cases"].get(name)
+        if previous is None:
+            continue
+        old_times = dict(zip(previous["sizes"], previous["median"]))
+        for size, seconds in zip(current["sizes"], current["median"]):
+            if old_times.get(size):
+                ratio = seconds / old_times[size]
+                if ratio > 1 + threshold:
+                    regressions.append((name, size, ratio))
+    return regressions
+
+
+def print_summary(results):
+    print()
+    print(f"{'Case':<32}  {'Points':>6}  {'Largest n':>10}  {'Time':>10}  Exponent")
+    for name, timings in results["cases"].items():
+        if not timings["sizes"]:
+            continue
+        exponent = timings["exponent"]
+        exponent = "-" if exponent is None else f"{exponent:.2f}"
+        print(
+            f"{name:<32}  {len(timings['sizes']):>6}  {timings['sizes'][-1]:>10}  "
+            f"{timings['median'][-1]:>9.4f}s  {exponent}"
+        )
+
+
+def save(results, path):
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)
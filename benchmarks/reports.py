@@ -0,0 +1,566 @@
+"""
+One-off comparisons that do not fit the size-scaling harness, such as memory
+use. Each report takes a size and an RNG seed and prints a small table.
+"""
+
+import multiprocessing
+import os
+import random
+import string
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.cases import (
+    LETTERS,
+    anagrams_49,
+    anagrams_input,
+    jewels_771,
+    pairs_2352,
+    random_word,
+    ransom_383,
+    trie_208,
+)
+from render_profile import peak_rss
+
+
+def measure(build):
+    """Return (result, seconds, bytes still allocated) for calling build()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, allocated
+
+
+def print_table(title, rows):
+    print(title)
+    width = max(len(row[0]) for row in rows)
+    for name, *columns in rows:
+        print((f"  {name:<{width}}  " + "  ".join(columns)).rstrip())
+
+
+def trie_memory(size=10**6, seed=0):
+    """Memory of the dict-of-dicts Trie against the compact engines."""
+    rng = random.Random(seed)
+    words = [random_word(rng) for _ in range(size)]
+    sorted_words = sorted(words)
+
+    def build_trie():
+        trie = trie_208.Trie()
+        for word in words:
+            trie.insert(word)
+        return trie
+
+    def build_compact():
+        trie = trie_208.CompactTrie()
+        for word in words:
+            trie.insert(word)
+        return trie
+
+    def build_radix():
+        trie = trie_208.RadixTrie()
+        for word in words:
+            trie.insert(word)
+        return trie
+
+    def bulk_load_compact():
+        trie = trie_208.CompactTrie()
+        trie.bulk_load(sorted_words)
+        return trie
+
+    rows = []
+    nodes = None
+    for name, build in [
+        ("Trie.insert", build_trie),
+        ("CompactTrie.insert", build_compact),
+        ("CompactTrie.bulk_load", bulk_load_compact),
+        ("RadixTrie.insert", build_radix),
+    ]:
+        trie, seconds, allocated = measure(build)
+        if isinstance(trie, trie_208.CompactTrie):
+            nodes = len(trie)
+        del trie
+        rows.append((name, f"{allocated / 2**20:>9.1f} MiB", f"{seconds:>7.2f}s"))
+
+    print_table(f"Trie memory, {size} words, {nodes} nodes", rows)
+
+
+def trie_mmap(size=10**6, seed=0):
+    """Cold start: rebuilding a Trie with insert() against Trie.open_mmap()."""
+    rng = random.Random(seed)
+    words = [random_word(rng) for _ in range(size)]
+    queries = words[: min(size, 1000)]
+
+    start = time.perf_counter()
+    trie = trie_208.Trie()
+    for word in words:
+        trie.insert(word)
+    for query in queries:
+        trie.search(query)
+    rebuild = time.perf_counter() - start
+
+    handle, path = tempfile.mkstemp(suffix=".trie")
+    os.close(handle)
+    try:
+        trie.save(path)
+        del trie
+        start = time.perf_counter()
+        with trie_208.Trie.open_mmap(path) as mapped:
+            for query in queries:
+                mapped.search(query)
+        opened = time.perf_counter() - start
+        file_size = os.path.getsize(path)
+    finally:
+        os.unlink(path)
+
+    print_table(
+        f"Trie cold start, {size} words, {len(queries)} lookups",
+        [
+            ("insert every word", f"{rebuild:>9.3f}s"),
+            ("open_mmap", f"{opened:>9.3f}s", f"{file_size / 2**20:.1f} MiB file"),
+        ],
+    )
+
+
+def concurrent_lookups(trie, words, readers, lock=None, timeout=10.0):
+    """
+    Insert 'words' from a writer thread while 'readers' threads search, and
+    stop the readers once the writer is done, so every lookup races a write.
+    The writer starts first. Everything stops after 'timeout' seconds, as a
+    writer waiting on 'lock' can be starved by the readers. Returns
+    (lookups, inserts, seconds). Without a lock the readers check every
+    snapshot: version k must hold exactly the first k words, and any
+    snapshot that does not raises RuntimeError.
+    """
+    lookups = [0] * readers
+    inserts = [0]
+    errors = []
+    done = threading.Event()
+    deadline = time.perf_counter() + timeout
+
+    def write():
+        try:
+            for word in words:
+                if time.perf_counter() > deadline:
+                    break
+                if lock is None:
+                    trie.insert(word)
+                else:
+                    with lock:
+                        trie.insert(word)
+                inserts[0] += 1
+        finally:
+            done.set()
+
+    def read(index):
+        rng = random.Random(index)
+        count = 0
+        while not done.is_set() and time.perf_counter() < deadline:
+            if lock is None:
+                snapshot = trie.snapshot()
+                k = snapshot.version
+                if k and not snapshot.search(words[k - 1]):
+                    errors.append(f"version {k} is missing word {k}")
+                if k < len(words) and snapshot.search(words[k]):
+                    errors.append(f"version {k} already has word {k + 1}")
+                snapshot.search(words[rng.randrange(len(words))])
+            else:
+                with lock:
+                    trie.search(words[rng.randrange(len(words))])
+            count += 1
+        lookups[index] = count
+
+    writer = threading.Thread(target=write)
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    start = time.perf_counter()
+    writer.start()
+    for thread in threads:
+        thread.start()
+    for thread in [writer, *threads]:
+        thread.join()
+    seconds = time.perf_counter() - start
+    if errors:
+        raise RuntimeError(
+            f"{len(errors)} inconsistent snapshot(s), the first: {errors[0]}"
+        )
+    return sum(lookups), inserts[0], seconds
+
+
+def trie_concurrent(size=10**4, seed=0, timeout=10.0):
+    """
+    Stress test and throughput for ConcurrentTrie against a plain Trie behind
+    one lock: one writer inserts 'size' words while 1, 4 and 16 reader
+    threads search, for as long as the inserts take.
+    """
+    rng = random.Random(seed)
+    words = list(dict.fromkeys(random_word(rng) for _ in range(size)))
+
+    rows = []
+    for readers in (1, 4, 16):
+        for name, trie, lock in [
+            ("ConcurrentTrie", trie_208.ConcurrentTrie(), None),
+            ("Trie + Lock", trie_208.Trie(), threading.Lock()),
+        ]:
+            lookups, inserts, seconds = concurrent_lookups(
+                trie, words, readers, lock, timeout
+            )
+            rows.append(
+                (
+                    f"{name}, {readers} reader(s)",
+                    f"{lookups / seconds:>12,.0f} lookups/s",
+                    f"{inserts / seconds:>10,.0f} inserts/s",
+                    (
+                        f"{seconds:>6.2f}s"
+                        if inserts == len(words)
+                        else f"writer starved: {inserts} inserts in {timeout}s"
+                    ),
+                )
+            )
+
+    print_table(
+        f"Concurrent Trie, one writer inserting {len(words)} words",
+        rows,
+    )
+
+
+def best_time(function, *args, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_symmetric_grid(n, rng):
+    """Values 1..3, symmetric so every row has an equal column."""
+    upper = np.triu(rng.integers(1, 4, size=(n, n), dtype=np.int64))
+    return upper + np.triu(upper, 1).T
+
+
+def equal_pairs_numpy(size=10_000, seed=0):
+    """Counter-of-tuples equalPairs against the NumPy path for n x n grids."""
+    rng = np.random.default_rng(seed)
+    solution = pairs_2352.Solution()
+
+    rows = []
+    for n in (1000, 4000, 10_000):
+        if n > size:
+            break
+        grid = random_symmetric_grid(n, rng)
+        lists = grid.tolist()
+        assert solution.equalPairs(lists) == solution.equalPairs(grid)
+        counter = best_time(solution.equalPairs, lists)
+        vectorized = best_time(solution.equalPairs, grid)
+        del lists
+        rows.append(
+            (
+                f"n = {n}",
+                f"Counter {counter:>8.3f}s",
+                f"NumPy {vectorized:>8.3f}s",
+                f"{counter / vectorized:>6.1f}x",
+            )
+        )
+
+    print_table("2352 equalPairs, lists against NumPy arrays", rows)
+
+
+def write_symmetric_grid(path, n, block_cells=1 << 22):
+    """
+    Write an n x n int32 '.npy' grid a stripe at a time, with
+    grid[i, j] = (i * j + i + j) % 3 so every row has an equal column.
+    """
+    grid = np.lib.format.open_memmap(path, mode="w+", dtype=np.int32, shape=(n, n))
+    columns = np.arange(n, dtype=np.int64)
+    step = max(1, block_cells // n)
+    for start in range(0, n, step):
+        rows = np.arange(start, min(n, start + step), dtype=np.int64)[:, None]
+        grid[start : start + step] = (rows * columns + rows + columns) % 3
+    grid.flush()
+    del grid
+
+
+def equal_pairs_loaded(path):
+    return pairs_2352.equal_pairs_array(np.load(path))
+
+
+def equal_pairs_mapped(path):
+    return pairs_2352.equal_pairs_file(path)
+
+
+def measure_peak_rss(function, *args):
+    """Run function(*args) and return (result, seconds, peak RSS in bytes)."""
+    start = time.perf_counter()
+    result = function(*args)
+    seconds = time.perf_counter() - start
+    return result, seconds, peak_rss()
+
+
+def in_fresh_process(function, *args):
+    """measure_peak_rss() in a newly spawned process, so peaks do not carry over."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure_peak_rss, function, *args).result()
+
+
+def equal_pairs_memmap(size=8000, seed=0):
+    """
+    Peak RSS of equalPairs on a grid file: np.load() into memory against the
+    striped memory-mapped path, for grids up to 'size' x 'size'.
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for n in (size // 4, size // 2, size):
+            path = os.path.join(directory, f"grid_{n}.npy")
+            write_symmetric_grid(path, n)
+            file_size = os.path.getsize(path)
+            for name, function in [
+                ("np.load", equal_pairs_loaded),
+                ("memmap", equal_pairs_mapped),
+            ]:
+                pairs, seconds, peak = in_fresh_process(function, path)
+                rows.append(
+                    (
+                        f"n = {n}, {name}",
+                        f"{file_size / 2**20:>7.0f} MiB file",
+                        f"peak RSS {peak / 2**20:>7.0f} MiB",
+                        f"{seconds:>6.2f}s",
+                        f"{pairs} pairs",
+                    )
+                )
+            os.unlink(path)
+
+    print_table("2352 equalPairs on int32 grid files", rows)
+
+
+def anagrams_cores(size=10**7, seed=0):
+    """groupAnagrams in one process against the sharded pool, 1 to N workers."""
+    (strs,) = anagrams_input(size, random.Random(seed))
+    expected = len(anagrams_49.Solution().groupAnagrams(strs))
+
+    rows = []
+    start = time.perf_counter()
+    anagrams_49.Solution().groupAnagrams(strs)
+    single = time.perf_counter() - start
+    rows.append(("Solution.groupAnagrams", f"{single:>8.2f}s"))
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        groups = anagrams_49.group_anagrams_parallel(strs, workers)
+        seconds = time.perf_counter() - start
+        assert len(groups) == expected
+        rows.append(
+            (
+                f"group_anagrams_parallel, {workers} worker(s)",
+                f"{seconds:>8.2f}s",
+                f"{single / seconds:>5.2f}x",
+            )
+        )
+        workers *= 2
+
+    print_table(f"49 groupAnagrams, {size} words, {expected} groups", rows)
+
+
+def anagrams_in_memory(path):
+    words = list(anagrams_49.iter_words(path))
+    return len(anagrams_49.Solution().groupAnagrams(words))
+
+
+def anagrams_spilled(path):
+    return sum(1 for _ in anagrams_49.group_anagrams_file(path))
+
+
+def anagrams_external(size=10**7, seed=0):
+    """Peak RSS of groupAnagrams on a word file: in memory against spilled."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "words.txt")
+        (strs,) = anagrams_input(size, random.Random(seed))
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(word + "\n" for word in strs)
+        del strs
+        file_size = os.path.getsize(path)
+
+        rows = []
+        for name, function in [
+            ("in memory", anagrams_in_memory),
+            ("group_anagrams_file", anagrams_spilled),
+        ]:
+            groups, seconds, peak = in_fresh_process(function, path)
+            rows.append(
+                (
+                    name,
+                    f"peak RSS {peak / 2**20:>7.0f} MiB",
+                    f"{seconds:>7.2f}s",
+                    f"{groups} groups",
+                )
+            )
+
+    print_table(f"49 groupAnagrams, {size} words, {file_size / 2**20:.0f} MiB", rows)
+
+
+def magazine_index(size=10**5, seed=0):
+    """
+    Throughput of 'size' canConstruct queries against one magazine: the
+    Counter per call, MagazineIndex per note, and MagazineIndex in batches.
+    The Counter baseline recounts the magazine every call, so it is timed on
+    the first 1000 notes only.
+    """
+    rng = random.Random(seed)
+    magazine = "".join(rng.choices(LETTERS, k=10**5))
+    notes = [random_word(rng, 1, 40) for _ in range(size)]
+    sample = notes[:1000]
+    start = time.perf_counter()
+    expected = [ransom_383.can_construct_counter(note, magazine) for note in sample]
+    counter = time.perf_counter() - start
+
+    index = ransom_383.MagazineIndex(magazine)
+    start = time.perf_counter()
+    single = [index.can_construct(note) for note in notes]
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = index.can_construct_many(notes)
+    batched = time.perf_counter() - start
+    assert single == batch.tolist() and single[: len(sample)] == expected
+
+    print_table(
+        f"383 canConstruct, {size} notes against a {len(magazine)} letter magazine",
+        [
+            (name, f"{count / seconds:>12,.0f} queries/s")
+            for name, count, seconds in [
+                ("can_construct_counter", len(sample), counter),
+                ("MagazineIndex.can_construct", size, one_by_one),
+                ("MagazineIndex.can_construct_many", size, batched),
+            ]
+        ],
+    )
+
+
+def jewel_matcher(size=10**6, seed=0):
+    """Scoring 'size' short stone strings against one jewel set."""
+    rng = random.Random(seed)
+    letters = string.ascii_letters
+    jewels = "".join(rng.sample(letters, 10))
+    stones = ["".join(rng.choices(letters, k=rng.randint(5, 50))) for _ in range(size)]
+    solution = jewels_771.Solution()
+
+    start = time.perf_counter()
+    expected = [solution.numJewelsInStones(jewels, stone) for stone in stones]
+    per_call = time.perf_counter() - start
+
+    matcher = jewels_771.JewelMatcher(jewels)
+    start = time.perf_counter()
+    counts = matcher.count_many(stones)
+    batched = time.perf_counter() - start
+    assert counts.tolist() == expected
+
+    print_table(
+        f"771 numJewelsInStones, {size} stone strings",
+        [
+            (name, f"{size / seconds:>12,.0f} strings/s")
+            for name, seconds in [
+                ("Solution.numJewelsInStones", per_call),
+                ("JewelMatcher.count_many", batched),
+            ]
+        ],
+    )
+
+
+def render_counting_partials(path, scene, case, coalesce, media_dir):
+    """
+    Render one scene with play coalescing on or off, and return the render
+    time and the number of partial movie files it wrote.
+    """
+    from render import RenderJob, render_scene
+
+    # Read by visualizations/coalesce.py when the scene plays
+    os.environ["SCENE_COALESCE"] = "1" if coalesce else "0"
+    job = RenderJob(Path(path), scene, case, "coalesced" if coalesce else "plain")
+    # No cache, so every play renders and writes its own file
+    result = render_scene(job, {"media_dir": media_dir, "disable_caching": True})
+    return result.seconds, len(list(Path(result.partial_movie_dir).glob("*.mp4")))
+
+
+def scene_coalescing(size=6, seed=0):
+    """
+    Partial movie files and render time of the 208 and 383 scenes with their
+    plays made one by one against coalesced, for 'size' letter inputs.
+    """
+    from loader import VISUALIZATIONS_DIR
+
+    rng = random.Random(seed)
+    word = "".join(rng.choices(LETTERS, k=size))
+    magazine = "".join(rng.choices(LETTERS, k=3 * size))
+    scenes = [
+        (
+            "208_animation.py",
+            "Animation208",
+            {
+                "operations": [
+                    ["insert", word],
+                    ["search", word],
+                    ["startsWith", word[: size // 2]],
+                    ["search", word[:-1]],
+                ]
+            },
+        ),
+        (
+            "383_animation.py",
+            "CanConstructExplanation",
+            {"ransom_note": "".join(rng.sample(magazine, size)), "magazine": magazine},
+        ),
+    ]
+
+    rows = []
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        for filename, scene, case in scenes:
+            path = str(VISUALIZATIONS_DIR / filename)
+            measured = {}
+            for coalesce in (False, True):
+                media_dir = os.path.join(directory, f"{scene}-{coalesce}")
+                # A fresh process each, so manim's config and caches start clean
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    measured[coalesce] = pool.submit(
+                        render_counting_partials, path, scene, case, coalesce, media_dir
+                    ).result()
+            plain, plain_files = measured[False]
+            coalesced, coalesced_files = measured[True]
+            rows += [
+                (
+                    f"{scene}, one play per call",
+                    f"{plain_files:>5} partial movies",
+                    f"{plain:>7.1f} s",
+                ),
+                (
+                    f"{scene}, coalesced",
+                    f"{coalesced_files:>5} partial movies",
+                    f"{coalesced:>7.1f} s",
+                    f"({1 - coalesced / plain:.0%} less time)",
+                ),
+            ]
+
+    print_table(f"Coalesced plays, {size} letter inputs", rows)
+
+
+REPORTS = {
+    "trie-memory": trie_memory,
+    "trie-mmap": trie_mmap,
+    "trie-concurrent": trie_concurrent,
+    "equal-pairs-numpy": equal_pairs_numpy,
+    "equal-pairs-memmap": equal_pairs_memmap,
+    "anagrams-cores": anagrams_cores,
+    "anagrams-external": anagrams_external,
+    "magazine-index": magazine_index,
+    "jewel-matcher": jewel_matcher,
+    "scene-coalescing": scene_coalescing,
+}
@@ -0,0 +1,44 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+VISUALIZATIONS_DIR = Path(__file__).resolve().parent / "visualizations"
+
+
+def load_module(path):
+    """
+    Import a visualization script by file path.
+    The scripts are named like '208_animation.py', so they cannot be imported
+    with a normal import statement. Like manim, put the script's folder on
+    sys.path first so sibling imports keep working.
+    """
+    path = Path(path).resolve()
+    name = path.stem
+    if name in sys.modules:
+        return sys.modules[name]
+
+    folder = str(path.parent)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None:
+        raise FileNotFoundError(f"{path} not found")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def animation_files():
+    """Every '*_animation.py' script, in a stable order."""
+    return sorted(VISUALIZATIONS_DIR.glob("*_animation.py"))
+
+
+def load_solution(problem):
+    """Import 'visualizations/<problem>_solution.py', e.g. load_solution(208)."""
+    return load_module(VISUALIZATIONS_DIR / f"{problem}_solution.py")
@@ -1,6 +1,246 @@
-def main():
-    print("Hello from leetcode-solution-visualizations!")
+import argparse
+import json
+import time
+from pathlib import Path
+
+import render
+from render_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, RenderCache
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Render and benchmark the LeetCode solution visualizations.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render_parser = commands.add_parser(
+        "render", help="Render every scene on a process pool."
+    )
+    render_parser.add_argument(
+        "scenes",
+        nargs="*",
+        help="Scene class names to render (default: all scenes).",
+    )
+    render_parser.add_argument(
+        "-q",
+        "--quality",
+        choices=render.QUALITY_NAMES,
+        help="manim quality preset, applied on top of manim.cfg.",
+    )
+    render_parser.add_argument(
+        "-r", "--resolution", help='Output resolution as "WIDTHxHEIGHT".'
+    )
+    render_parser.add_argument("--fps", type=int, help="Output frame rate.")
+    render_parser.add_argument(
+        "--draft",
+        action="store_true",
+        help="Render small and at a low frame rate (426x240 at 10 fps) to check "
+        "layout; -q, -r and --fps still apply on top.",
+    )
+    render_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes (default: one per CPU core).",
+    )
+    render_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render every scene even if a cached movie is up to date.",
+    )
+    render_parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Where cached movies are kept (default: media/render_cache).",
+    )
+    render_parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_BYTES // 1024**2,
+        help="Cache size limit in MB; least recently used movies go first.",
+    )
+    modes = render_parser.add_mutually_exclusive_group()
+    modes.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Time every play/wait call and write a hotspot table and a "
+        "Chrome trace per scene to DIR (renders without any cache).",
+    )
+    modes.add_argument(
+        "--keyframes",
+        action="store_true",
+        help="Write no movie, only the last frame of each play as a PNG.",
+    )
+    cases = render_parser.add_mutually_exclusive_group()
+    cases.add_argument(
+        "--cases",
+        metavar="FILE",
+        help="JSON or YAML file of inputs; renders one movie per case "
+        "of a single scene.",
+    )
+    cases.add_argument(
+        "--input",
+        metavar="JSON",
+        type=parse_case,
+        help="Inputs for a single scene, e.g. '{\"cards\": [1, 2, 1]}'.",
+    )
+
+    bench_parser = commands.add_parser(
+        "bench", help="Time every solution across log-spaced input sizes."
+    )
+    bench_parser.add_argument(
+        "--report",
+        help="Run one of the one-off reports instead, e.g. trie-memory.",
+    )
+    bench_parser.add_argument(
+        "--report-size",
+        type=parse_size,
+        help="Input size for --report (each report has its own default).",
+    )
+    bench_parser.add_argument(
+        "cases",
+        nargs="*",
+        help='Only run cases whose name contains one of these, e.g. "2352".',
+    )
+    bench_parser.add_argument("--min-size", type=parse_size, default=10**2)
+    bench_parser.add_argument("--max-size", type=parse_size, default=10**7)
+    bench_parser.add_argument(
+        "--per-decade", type=int, default=1, help="Sizes per power of ten."
+    )
+    bench_parser.add_argument("--repeats", type=int, default=5)
+    bench_parser.add_argument("--warmup", type=int, default=1)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("-o", "--output", help="Write results as JSON.")
+    bench_parser.add_argument(
+        "--baseline", help="Results JSON to compare against for regressions."
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Slowdown ratio above which a point is flagged (default: 0.1).",
+    )
+
+    return parser
+
+
+def parse_size(text):
+    """Accept sizes such as 1000, 1e6 or 10**7."""
+    if "**" in text:
+        base, exponent = text.split("**")
+        return int(base) ** int(exponent)
+    return int(float(text))
+
+
+def parse_case(text):
+    """Accept the inputs of one scene as a JSON object."""
+    try:
+        case = json.loads(text)
+    except json.JSONDecodeError as error:
+        raise argparse.ArgumentTypeError(f"invalid JSON: {error}") from None
+    if not isinstance(case, dict):
+        raise argparse.ArgumentTypeError(
+            f"expected a JSON object of scene inputs, got {text!r}"
+        )
+    return case
+
+
+def run_render(args):
+    jobs = render.discover_scenes(args.scenes or None)
+    if args.cases or args.input:
+        if len(jobs) != 1:
+            raise SystemExit("--cases and --input need exactly one scene name")
+        if args.cases:
+            try:
+                cases = render.load_cases(args.cases)
+            except ValueError as error:
+                raise SystemExit(f"Bad case file: {error}") from None
+        else:
+            cases = [{"name": "input", **args.input}]
+        jobs = render.case_jobs(jobs[0], cases)
+    overrides = render.config_overrides(
+        args.quality, args.resolution, args.fps, draft=args.draft
+    )
+
+    start = time.perf_counter()
+    # Profiles and keyframes have to render every scene, so skip the cache
+    use_cache = not (args.no_cache or args.profile or args.keyframes)
+    if not use_cache:
+        results, failed = render.render_all(
+            jobs,
+            overrides,
+            workers=args.jobs,
+            profile_dir=args.profile,
+            keyframes=args.keyframes,
+        )
+    else:
+        cache = RenderCache(args.cache_dir, args.cache_size * 1024**2)
+        results, failed = render.render_cached(
+            jobs, overrides, cache, workers=args.jobs
+        )
+    render.print_summary(results, time.perf_counter() - start)
+    if use_cache:
+        cache.print_report()
+    if args.profile:
+        for result in results:
+            print()
+            print(
+                Path(args.profile, f"{result.scene}.hotspots.txt").read_text(), end=""
+            )
+        print(f"\nChrome traces written to {args.profile}")
+
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+def run_bench(args):
+    from benchmarks import harness
+    from benchmarks.cases import CASES
+
+    if args.report:
+        from benchmarks.reports import REPORTS
+
+        if args.report not in REPORTS:
+            raise SystemExit(f"Unknown report, pick one of: {', '.join(REPORTS)}")
+        options = {"seed": args.seed}
+        if args.report_size:
+            options["size"] = args.report_size
+        REPORTS[args.report](**options)
+        return 0
+
+    cases = [
+        case
+        for case in CASES
+        if not args.cases or any(name in case.name for name in args.cases)
+    ]
+    sizes = harness.log_sizes(args.min_size, args.max_size, args.per_decade)
+    results = harness.run_cases(cases, sizes, args.repeats, args.warmup, args.seed)
+    harness.print_summary(results)
+    if args.output:
+        harness.save(results, args.output)
+
+    if args.baseline:
+        regressions = harness.compare(
+            results, harness.load(args.baseline), args.threshold
+        )
+        for name, size, ratio in regressions:
+            print(f"REGRESSION {name} n={size}: {ratio:.2f}x the baseline time")
+        if regressions:
+            return 1
+        print("No regressions against the baseline.")
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "render":
+        return run_render(args)
+    if args.command == "bench":
+        return run_bench(args)
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,302 @@
+import os
+import re
+import shutil
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from loader import VISUALIZATIONS_DIR, animation_files, load_module
+from render_cache import cache_key
+from render_keyframes import KEYFRAME_OPTIONS, KeyframeWriter, keyframe_dir
+from render_profile import PlayProfiler
+
+QUALITY_NAMES = ["low", "medium", "high", "production", "fourk"]
+# Small and choppy, but enough to check a scene's layout and pacing
+DRAFT_OPTIONS = {"pixel_width": 426, "pixel_height": 240, "frame_rate": 10}
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """
+    One scene to render. Batch renders give each job a 'case' of scene
+    inputs (see visualizations/scene_cases.py) and a 'case_name'.
+    """
+
+    path: Path
+    scene: str
+    case: dict | None = None
+    case_name: str | None = None
+
+    @property
+    def name(self):
+        if self.case_name is None:
+            return self.scene
+        return f"{self.scene}[{self.case_name}]"
+
+
+@dataclass
+class RenderResult:
+    scene: str
+    seconds: float
+    frames: int
+    output: str
+    cached: bool = False
+    partial_movie_dir: str = ""
+
+
+def discover_scenes(names=None):
+    """
+    Import every '*_animation.py' script and collect the Scene subclasses
+    it defines. If 'names' is given, only keep scenes with those class names.
+    """
+    from manim import Scene
+
+    jobs = []
+    for path in animation_files():
+        module = load_module(path)
+        for attr, value in vars(module).items():
+            if (
+                isinstance(value, type)
+                and issubclass(value, Scene)
+                and value.__module__ == module.__name__
+                and (names is None or attr in names)
+            ):
+                jobs.append(RenderJob(path, attr))
+
+    if names is not None:
+        missing = set(names) - {job.scene for job in jobs}
+        if missing:
+            raise SystemExit(f"Unknown scene(s): {', '.join(sorted(missing))}")
+    return jobs
+
+
+def load_cases(path):
+    """Read a JSON or YAML case file into a list of scene inputs."""
+    return load_module(VISUALIZATIONS_DIR / "scene_cases.py").load_cases(path)
+
+
+def case_jobs(job, cases):
+    """
+    One job per case for the scene in 'job'. Cases are named by their
+    "name" key, or by their position, and the name is made safe to use in
+    file names.
+    """
+    jobs = []
+    for i, case in enumerate(cases):
+        name = re.sub(r"[^\w-]+", "_", str(case.get("name", f"case{i}")))
+        jobs.append(RenderJob(job.path, job.scene, case, name))
+    if len({job.case_name for job in jobs}) != len(jobs):
+        raise SystemExit("Case names must be unique")
+    return jobs
+
+
+def config_overrides(quality=None, resolution=None, frame_rate=None, draft=False):
+    """
+    Build the manim config options layered on top of manim.cfg.
+    'quality' picks one of manim's presets, or 'draft' the DRAFT_OPTIONS
+    one; 'resolution' is "WIDTHxHEIGHT" and 'frame_rate' wins over the
+    preset's frame rate.
+    """
+    from manim.constants import QUALITIES
+
+    overrides = dict(DRAFT_OPTIONS) if draft else {}
+    if quality is not None:
+        preset = QUALITIES[f"{quality}_quality"]
+        overrides["pixel_width"] = preset["pixel_width"]
+        overrides["pixel_height"] = preset["pixel_height"]
+        overrides["frame_rate"] = preset["frame_rate"]
+    if resolution is not None:
+        width, height = resolution.lower().split("x")
+        overrides["pixel_width"] = int(width)
+        overrides["pixel_height"] = int(height)
+    if frame_rate is not None:
+        overrides["frame_rate"] = frame_rate
+    return overrides
+
+
+def render_scene(job, overrides, seed_dir=None, profile_dir=None, keyframes=False):
+    """
+    Render one scene in the current process. Runs inside the pool workers.
+    A job with a case writes its own movie and partial movie files. Partial
+    movies already in 'seed_dir' are copied in first, so animations that do
+    not depend on the case (such as the title) come from manim's cache.
+    With 'profile_dir', every play is rendered (not taken from manim's
+    cache) and timed, and render_profile.py writes its report there.
+    With 'keyframes', no movie is made: render_keyframes.py saves the end
+    of each play as a PNG, and the result's output is their folder.
+    """
+    from manim import config, tempconfig
+
+    module = load_module(job.path)
+    scene_class = getattr(module, job.scene)
+
+    options = {"input_file": str(job.path), **overrides}
+    if profile_dir is not None:
+        options["disable_caching"] = True
+    if keyframes:
+        options.update(KEYFRAME_OPTIONS)
+    if job.case is not None:
+        options["output_file"] = f"{job.scene}_{job.case_name}"
+        options["partial_movie_dir"] = (
+            "{media_dir}/videos/{module_name}/{quality}/partial_movie_files/"
+            f"{job.scene}/{job.case_name}"
+        )
+
+    start = time.perf_counter()
+    with tempconfig(options), ExitStack() as hooks:
+        scene = scene_class()
+        scene.case = job.case
+        file_writer = scene.renderer.file_writer
+        # Only movie renders have partial movies
+        partial_movie_dir = ""
+        if config.write_to_movie:
+            partial_movie_dir = file_writer.partial_movie_directory
+            if seed_dir:
+                _seed_partial_movies(Path(seed_dir), partial_movie_dir)
+        if profile_dir is not None:
+            profiler = hooks.enter_context(PlayProfiler().installed())
+        if keyframes:
+            writer = KeyframeWriter(keyframe_dir(file_writer.image_file_path))
+            hooks.enter_context(writer.installed())
+        scene.render()
+        if keyframes:
+            frames = len(writer.paths)
+            output = str(writer.directory)
+        else:
+            frames = round(scene.renderer.time * config.frame_rate)
+            output = str(file_writer.movie_file_path)
+    seconds = time.perf_counter() - start
+    if profile_dir is not None:
+        profiler.save(profile_dir, job.name)
+
+    return RenderResult(
+        job.name, seconds, frames, output, False, str(partial_movie_dir)
+    )
+
+
+def _seed_partial_movies(source, target):
+    """Copy the partial movies in 'source' that 'target' does not have yet."""
+    for movie in source.glob("*.mp4"):
+        if not (target / movie.name).exists():
+            shutil.copy2(movie, target / movie.name)
+
+
+def render_all(
+    jobs, overrides, workers=None, profile_dir=None, keyframes=False, on_result=None
+):
+    """
+    Render 'jobs' on a process pool, one scene per task.
+    Returns (results, failed) where 'failed' lists the scenes that raised.
+    When a scene has several cases the first one renders on its own, and
+    the rest start once it is done, seeded with its partial movies.
+    'profile_dir' and 'keyframes' are passed on to render_scene(), and
+    on_result(result) is called as each scene finishes.
+    """
+    results = []
+    failed = []
+    if not jobs:
+        return results, failed
+
+    first = []
+    followers = {}
+    for job in jobs:
+        if job.case is not None and job.scene in followers:
+            followers[job.scene].append(job)
+        else:
+            first.append(job)
+            if job.case is not None:
+                followers[job.scene] = []
+
+    render_job = partial(render_scene, profile_dir=profile_dir, keyframes=keyframes)
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(render_job, job, overrides): job for job in first}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    seed_dir = None
+                    # Any error fails only its own scene, whether a bad case
+                    # or a bug, so the other scenes still render
+                    try:
+                        result = future.result()
+                    except Exception as error:  # noqa: BLE001
+                        print(f"Failed {job.name}: {error!r}")
+                        traceback.print_exception(error)
+                        failed.append(job.name)
+                    else:
+                        print(f"Rendered {result.scene} in {result.seconds:.1f}s")
+                        results.append(result)
+                        seed_dir = result.partial_movie_dir
+                        if on_result is not None:
+                            on_result(result)
+                    if job.case is not None:
+                        for follower in followers.pop(job.scene, []):
+                            future = executor.submit(
+                                render_job, follower, overrides, seed_dir
+                            )
+                            pending[future] = follower
+        except BaseException:
+            # e.g. Ctrl+C: do not wait for the renders that have not started
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    order = {job.name: i for i, job in enumerate(jobs)}
+    results.sort(key=lambda result: order[result.scene])
+    return results, failed
+
+
+def render_cached(jobs, overrides, cache, workers=None):
+    """
+    Like render_all, but reuse movies from 'cache' when a scene's cache key
+    is unchanged and store the newly rendered ones afterwards.
+    """
+    results = []
+    pending = []
+    keys = {}
+    for job in jobs:
+        key = cache_key(job, overrides)
+        entry = cache.lookup(key, job.name)
+        if entry is None:
+            keys[job.name] = key
+            pending.append(job)
+        else:
+            results.append(
+                RenderResult(job.name, 0.0, entry["frames"], entry["output"], True)
+            )
+
+    # Movies are stored as they finish, and the index is saved even if the
+    # batch is interrupted
+    try:
+        rendered, failed = render_all(
+            pending,
+            overrides,
+            workers,
+            on_result=lambda result: cache.store(keys[result.scene], result),
+        )
+    finally:
+        cache.save()
+
+    order = {job.name: i for i, job in enumerate(jobs)}
+    results = sorted(results + rendered, key=lambda result: order[result.scene])
+    return results, failed
+
+
+def print_summary(results, wall_time):
+    """Print one line per scene: wall time, frame count and output path."""
+    width = max([len(result.scene) for result in results] + [len("Scene")])
+    print()
+    print(f"{'Scene':<{width}}  {'Time':>8}  {'Frames':>6}  Output")
+    for result in results:
+        seconds = "cached" if result.cached else f"{result.seconds:.1f}s"
+        print(
+            f"{result.scene:<{width}}  {seconds:>8}  "
+            f"{result.frames:>6}  {result.output}"
+        )
+    total = sum(result.seconds for result in results)
+    print(f"\n{len(results)} scene(s), {total:.1f}s of rendering in {wall_time:.1f}s")
@@ -0,0 +1,172 @@
+import ast
+import hashlib
+import json
+import shutil
+import time
+from pathlib import Path
+
+from loader import VISUALIZATIONS_DIR, load_module
+
+ROOT_DIR = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIR = ROOT_DIR / "media" / "render_cache"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+def local_dependencies(path):
+    """
+    Return the visualization files 'path' depends on, including itself.
+    That is every sibling module it imports (recursively), either with an
+    import statement or with importlib.import_module("208_solution"), plus
+    the matching '*_solution.py' file, e.g. '208_solution.py' for
+    '208_animation.py'.
+    """
+    path = Path(path).resolve()
+    seen = set()
+    pending = [path]
+    solution = path.with_name(path.name.replace("_animation", "_solution"))
+    if solution.exists():
+        pending.append(solution)
+
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+
+        tree = ast.parse(current.read_text(), filename=str(current))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            elif _is_import_module_call(node):
+                names = [node.args[0].value]
+            else:
+                continue
+            for name in names:
+                candidate = VISUALIZATIONS_DIR / f"{name.split('.')[0]}.py"
+                if candidate.exists():
+                    pending.append(candidate.resolve())
+
+    return sorted(seen)
+
+
+def _is_import_module_call(node):
+    """Whether 'node' is import_module("name") with a literal module name."""
+    if not isinstance(node, ast.Call) or not node.args:
+        return False
+    function = node.func
+    name = function.attr if isinstance(function, ast.Attribute) else None
+    if isinstance(function, ast.Name):
+        name = function.id
+    argument = node.args[0]
+    return (
+        name == "import_module"
+        and isinstance(argument, ast.Constant)
+        and isinstance(argument.value, str)
+    )
+
+
+def cache_key(job, overrides):
+    """
+    Hash everything that decides what a scene renders to: the scene name,
+    its case of inputs (the job's, or else the one SCENE_CASE names), the
+    source of the scene file and its local dependencies (the default inputs
+    are there), manim.cfg, the overrides and manim's version.
+    """
+    import manim
+
+    digest = hashlib.sha256()
+    digest.update(job.scene.encode())
+    case = job.case
+    if case is None:
+        # Scenes read SCENE_CASE themselves when render.py gives them no case
+        scene_cases = load_module(VISUALIZATIONS_DIR / "scene_cases.py")
+        case = scene_cases.case_from_env() or None
+    digest.update(json.dumps(case, sort_keys=True).encode())
+    for dependency in local_dependencies(job.path):
+        digest.update(dependency.name.encode())
+        digest.update(dependency.read_bytes())
+
+    cfg = ROOT_DIR / "manim.cfg"
+    if cfg.exists():
+        digest.update(cfg.read_bytes())
+    digest.update(json.dumps(overrides, sort_keys=True, default=str).encode())
+    digest.update(manim.__version__.encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    Rendered movies stored by cache key, with an index.json recording size,
+    original render time and last use. Old entries are evicted LRU first once
+    the total size goes over 'max_bytes'.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.index_path = self.directory / "index.json"
+        self.index = {}
+        if self.index_path.exists():
+            self.index = json.loads(self.index_path.read_text())
+        self.hits = []
+        self.misses = []
+
+    def lookup(self, key, scene):
+        """
+        Return the cached entry for 'key' after copying its movie back to the
+        original output path, or None on a miss.
+        """
+        entry = self.index.get(key)
+        cached_file = self.directory / f"{key}.mp4"
+        if entry is None or not cached_file.exists():
+            self.index.pop(key, None)
+            self.misses.append(scene)
+            return None
+
+        output = Path(entry["output"])
+        if not output.exists() or output.stat().st_size != entry["size"]:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(cached_file, output)
+
+        entry["last_used"] = time.time()
+        self.hits.append((scene, entry["seconds"]))
+        return entry
+
+    def store(self, key, result):
+        """Copy a freshly rendered movie into the cache."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        cached_file = self.directory / f"{key}.mp4"
+        shutil.copy2(result.output, cached_file)
+        self.index[key] = {
+            "scene": result.scene,
+            "output": result.output,
+            "seconds": result.seconds,
+            "frames": result.frames,
+            "size": cached_file.stat().st_size,
+            "last_used": time.time(),
+        }
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits 'max_bytes'."""
+        total = sum(entry["size"] for entry in self.index.values())
+        by_age = sorted(self.index.items(), key=lambda item: item[1]["last_used"])
+        for key, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            (self.directory / f"{key}.mp4").unlink(missing_ok=True)
+            del self.index[key]
+            total -= entry["size"]
+
+    def save(self):
+        self.evict()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path.write_text(json.dumps(self.index, indent=2))
+
+    def print_report(self):
+        saved = sum(seconds for _, seconds in self.hits)
+        print(
+            f"Render cache: {len(self.hits)} hit(s), {len(self.misses)} miss(es), "
+            f"~{saved:.1f}s of rendering saved"
+        )
@@ -0,0 +1,69 @@
+"""
+Layout checks without a movie. A keyframes render runs the scene with
+manim's save_last_frame, which moves every animation straight to its end
+instead of rendering its frames, and KeyframeWriter saves the frame after
+each play as a PNG: '001.png', '002.png' and so on, next to the scene's
+last-frame image. Plays merged by 'with self.coalesced():' give one
+keyframe for the whole block.
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+# manim options for a keyframes render: no movie, animations skip to their end
+KEYFRAME_OPTIONS = {"save_last_frame": True, "write_to_movie": False}
+
+
+def keyframe_dir(image_file_path):
+    """Where the keyframes of the scene with this last-frame image go."""
+    path = Path(image_file_path)
+    return path.with_name(f"{path.stem}_keyframes")
+
+
+class KeyframeWriter:
+    """Saves the frame after every Scene.play call while installed()."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.paths = []
+        self._depth = 0
+
+    @contextmanager
+    def installed(self):
+        """Save keyframes of every scene rendered in this block."""
+        from manim import Scene
+
+        play, wait = Scene.play, Scene.wait
+        Scene.play = self._wrap(play, save=True)
+        Scene.wait = self._wrap(wait, save=False)
+        try:
+            yield self
+        finally:
+            Scene.play, Scene.wait = play, wait
+
+    def _wrap(self, method, save):
+        writer = self
+
+        @wraps(method)
+        def wrapped(scene, *args, **kwargs):
+            writer._depth += 1
+            try:
+                result = method(scene, *args, **kwargs)
+            finally:
+                writer._depth -= 1
+            # Scene.wait() calls play() too, but does not change the frame
+            if save and not writer._depth:
+                writer.save(scene)
+            return result
+
+        return wrapped
+
+    def save(self, scene):
+        """Draw the scene as it is now and write it as the next keyframe."""
+        renderer = scene.renderer
+        renderer.update_frame(scene)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{len(self.paths) + 1:03d}.png"
+        renderer.camera.get_image().save(path)
+        self.paths.append(path)
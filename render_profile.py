@@ -0,0 +1,232 @@
+"""
+Where a scene's render time goes. PlayProfiler wraps Scene.play and
+Scene.wait while a scene renders, and records for each call the line of the
+scene that made it, the wall time, the frames written, the number of
+mobjects on screen and the peak RSS so far. save() writes two files:
+
+    - '<scene>.hotspots.txt', the call sites sorted by total time;
+    - '<scene>.trace.json', one event per call in the Chrome trace format,
+      for chrome://tracing or https://ui.perfetto.dev.
+
+Plays merged by 'with self.coalesced():' show up as one call on the line of
+the 'with' statement.
+"""
+
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import wraps
+from pathlib import Path
+
+# Frames from these files are skipped when looking for the call site
+_INTERNAL_FILES = (__file__, "coalesce.py", "contextlib.py")
+
+
+@dataclass
+class PlayRecord:
+    site: str  # e.g. "208_animation.py:76 replay_call"
+    kind: str  # "play" or "wait"
+    start: float  # seconds since the profiler was installed
+    seconds: float
+    frames: int
+    mobjects: int
+    peak_rss: int  # bytes, for the whole process so far
+    rss_growth: int  # how much this call raised peak_rss
+
+
+def peak_rss():
+    """
+    Peak resident set size of this process in bytes. Prefer VmHWM on Linux:
+    ru_maxrss carries over the parent's RSS into a forked and exec'd child.
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # Only on Unix, so not imported at the top
+    import resource
+
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def call_site():
+    """'file:line function' of the scene code that called play() or wait()."""
+    frame = sys._getframe(2)
+    fallback = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.endswith("_animation.py"):
+            break
+        if fallback is None and not filename.endswith(_INTERNAL_FILES):
+            fallback = frame
+        frame = frame.f_back
+    frame = frame or fallback
+    if frame is None:
+        return "<unknown>"
+    name = os.path.basename(frame.f_code.co_filename)
+    return f"{name}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+class PlayProfiler:
+    """Records every Scene.play and Scene.wait call while installed()."""
+
+    def __init__(self):
+        self.records = []
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    @contextmanager
+    def installed(self):
+        """Profile every scene rendered in this block."""
+        from manim import Scene
+
+        play, wait = Scene.play, Scene.wait
+        Scene.play = self._wrap(play, "play")
+        Scene.wait = self._wrap(wait, "wait")
+        self._origin = time.perf_counter()
+        try:
+            yield self
+        finally:
+            Scene.play, Scene.wait = play, wait
+
+    def _wrap(self, method, kind):
+        from manim import config
+
+        profiler = self
+
+        @wraps(method)
+        def profiled(scene, *args, **kwargs):
+            # Scene.wait() calls play(); only the outer call is recorded
+            if profiler._depth:
+                return method(scene, *args, **kwargs)
+            site = call_site()
+            renderer = scene.renderer
+            time_before = renderer.time
+            rss_before = peak_rss()
+            profiler._depth += 1
+            start = time.perf_counter()
+            try:
+                return method(scene, *args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                profiler._depth -= 1
+                # Animations skipped or taken from manim's cache write no frames
+                frames = 0
+                if not renderer.skip_animations:
+                    frames = round((renderer.time - time_before) * config.frame_rate)
+                rss = peak_rss()
+                profiler.records.append(
+                    PlayRecord(
+                        site,
+                        kind,
+                        start - profiler._origin,
+                        seconds,
+                        frames,
+                        len(scene.get_mobject_family_members()),
+                        rss,
+                        rss - rss_before,
+                    )
+                )
+
+        return profiled
+
+    def hotspots(self):
+        """Per call site totals, the slowest site first."""
+        sites = defaultdict(
+            lambda: {
+                "calls": 0,
+                "seconds": 0.0,
+                "frames": 0,
+                "mobjects": 0,
+                "rss_growth": 0,
+            }
+        )
+        for record in self.records:
+            site = sites[record.site]
+            site["calls"] += 1
+            site["seconds"] += record.seconds
+            site["frames"] += record.frames
+            site["mobjects"] = max(site["mobjects"], record.mobjects)
+            site["rss_growth"] += record.rss_growth
+        return sorted(sites.items(), key=lambda item: item[1]["seconds"], reverse=True)
+
+    def format_hotspots(self, title):
+        """The hotspots as a text table."""
+        hotspots = self.hotspots()
+        total = sum(site["seconds"] for _, site in hotspots)
+        width = max([len(name) for name, _ in hotspots] + [len("Call site")])
+        lines = [
+            title,
+            (
+                f"{'Call site':<{width}}  {'Calls':>5}  {'Time':>8}  {'Share':>5}  "
+                f"{'Frames':>6}  {'ms/frame':>8}  {'Mobjects':>8}  {'RSS +MiB':>8}"
+            ),
+        ]
+        for name, site in hotspots:
+            per_frame = (
+                f"{1000 * site['seconds'] / site['frames']:.1f}"
+                if site["frames"]
+                else "-"
+            )
+            lines.append(
+                f"{name:<{width}}  {site['calls']:>5}  {site['seconds']:>7.2f}s  "
+                f"{site['seconds'] / (total or 1):>5.0%}  {site['frames']:>6}  "
+                f"{per_frame:>8}  {site['mobjects']:>8}  "
+                f"{site['rss_growth'] / 1024**2:>8.1f}"
+            )
+        peak = max((record.peak_rss for record in self.records), default=0)
+        lines.append(
+            f"{len(self.records)} call(s), {total:.2f}s in play/wait, "
+            f"peak RSS {peak / 1024**2:.0f} MiB"
+        )
+        return "\n".join(lines) + "\n"
+
+    def chrome_trace(self, name):
+        """The records as a Chrome trace: one complete event per call."""
+        pid = os.getpid()
+        events = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}}
+        ]
+        for record in self.records:
+            start = round(record.start * 1e6)
+            events.append(
+                {
+                    "name": record.site,
+                    "cat": record.kind,
+                    "ph": "X",
+                    "ts": start,
+                    "dur": round(record.seconds * 1e6),
+                    "pid": pid,
+                    "tid": 0,
+                    "args": asdict(record),
+                }
+            )
+            events.append(
+                {
+                    "name": "peak RSS (MiB)",
+                    "ph": "C",
+                    "ts": start + round(record.seconds * 1e6),
+                    "pid": pid,
+                    "args": {"peak": round(record.peak_rss / 1024**2, 1)},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, directory, name):
+        """Write '<name>.hotspots.txt' and '<name>.trace.json' to 'directory'."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        table = directory / f"{name}.hotspots.txt"
+        table.write_text(self.format_hotspots(f"{name}: play/wait hotspots"))
+        trace = directory / f"{name}.trace.json"
+        trace.write_text(json.dumps(self.chrome_trace(name)))
+        return table, trace
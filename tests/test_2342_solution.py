@@ -0,0 +1,33 @@
+import unittest
+
+import numpy as np
+
+from loader import load_solution
+
+solution_2342 = load_solution(2342)
+
+
+class MaximumSumTest(unittest.TestCase):
+    def test_pairs(self):
+        solution = solution_2342.Solution()
+        self.assertEqual(solution.maximumSum([18, 43, 36, 13, 7]), 54)
+        self.assertEqual(solution.maximumSum([10, 12, 19, 14]), -1)
+        self.assertEqual(solution.maximumSum(np.array([18, 43, 36, 13, 7])), 54)
+
+    def test_negative_input_raises(self):
+        # Regression: the digit loops never reached zero for negative numbers
+        solution = solution_2342.Solution()
+        with self.assertRaises(ValueError):
+            solution.maximumSum([-5, 14])
+        with self.assertRaises(ValueError):
+            solution.maximumSum(np.array([-5, 14]))
+        with self.assertRaises(ValueError):
+            solution.maximumSum(np.array([-5]))
+
+    def test_wrapping_uint64_input_raises(self):
+        with self.assertRaises(ValueError):
+            solution_2342.maximum_sum_array(np.array([2**64 - 1, 14], dtype=np.uint64))
+
+
+if __name__ == "__main__":
+    unittest.main()
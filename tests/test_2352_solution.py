@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from loader import load_solution
+
+solution_2352 = load_solution(2352)
+
+
+class EqualPairsTest(unittest.TestCase):
+    def test_pairs(self):
+        grid = [[3, 1, 2, 2], [1, 4, 4, 5], [2, 4, 2, 2], [2, 4, 2, 2]]
+        solution = solution_2352.Solution()
+        self.assertEqual(solution.equalPairs(grid), 3)
+        self.assertEqual(solution.equalPairs(np.array(grid)), 3)
+        self.assertEqual(solution_2352.equal_pairs_array(np.array(grid), 1), 3)
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "grid.npy")
+            np.save(path, np.ones((64, 64), dtype=np.int64))
+            self.assertEqual(solution_2352.equal_pairs_file(path), 64 * 64)
+
+    def test_copy_on_write_edits_are_kept(self):
+        # Regression: pages of a caller's memmap were dropped while reading,
+        # which threw away its copy-on-write edits
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "grid.npy")
+            np.save(path, np.arange(64 * 64, dtype=np.int64).reshape(64, 64))
+            grid = np.load(path, mmap_mode="c")
+            grid[:] = 1
+            pairs = solution_2352.equal_pairs_array(grid, block_cells=256)
+            self.assertEqual(pairs, 64 * 64)
+            self.assertEqual(int(grid.sum()), 64 * 64)
+            del grid
+
+
+if __name__ == "__main__":
+    unittest.main()
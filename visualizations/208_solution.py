@@ -1,22 +1,97 @@
+import heapq
+import mmap
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+# Header of a saved Trie: magic, format version, byte-order check, node count
+TRIE_FILE_HEADER = struct.Struct("=4sIII")
+TRIE_FILE_MAGIC = b"TRIE"
+TRIE_FILE_VERSION = 1
+BYTE_ORDER_CHECK = 0x01020304
+
+
 class TrieNode:
+    __slots__ = ("children", "is_end_of_word", "top", "weight", "word_count")
+
     def __init__(self):
         self.children = {}
         self.is_end_of_word = False
+        self.word_count = 0  # words ending at or below this node
+        self.weight = 0
+        self.top = None  # cached (-weight, word) pairs for top_k, best first
 
 
 class Trie:
-    def __init__(self):
+    # Optional tracing.Trace that insert(), search() and startsWith() report
+    # their steps to, one letter per 'visit' or 'insert' event
+    tracer = None
+
+    def __init__(self, tracer=None):
         self.root = TrieNode()
+        self.tracer = tracer
 
-    def insert(self, word: str) -> None:
+    def insert(self, word: str, weight: int | None = None) -> None:
+        """
+        Add 'word'. 'weight' ranks it in top_k(); new words default to 1, and
+        inserting a word that is already there only updates its weight.
+        """
+        tracer = self.tracer
+        if tracer is not None:
+            self._trace_insert(word)
         current = self.root
+        path = [current]
         for letter in word:
             if letter not in current.children:
                 current.children[letter] = TrieNode()
             current = current.children[letter]
-        current.is_end_of_word = True
+            path.append(current)
+
+        if not current.is_end_of_word:
+            current.is_end_of_word = True
+            current.weight = 1 if weight is None else weight
+            for node in path:
+                node.word_count += 1
+                node.top = None
+            if tracer is not None:
+                tracer.emit("update", "is_end_of_word", word, True)
+        elif weight is not None and weight != current.weight:
+            current.weight = weight
+            for node in path:
+                node.top = None
+
+        if tracer is not None:
+            tracer.emit("result", None)
+
+    def delete(self, word: str) -> bool:
+        """Remove 'word' and any nodes only it used. Returns False if absent."""
+        path = [self.root]
+        for letter in word:
+            child = path[-1].children.get(letter)
+            if child is None:
+                return False
+            path.append(child)
+        if not path[-1].is_end_of_word:
+            return False
+
+        path[-1].is_end_of_word = False
+        path[-1].weight = 0
+        for node in path:
+            node.word_count -= 1
+            node.top = None
+
+        # Nodes left without words form the tail of the path; cut it off
+        for depth in range(1, len(path)):
+            if not path[depth].word_count:
+                del path[depth - 1].children[word[depth - 1]]
+                break
+        return True
 
     def search(self, word: str) -> bool:
+        if self.tracer is not None:
+            return self._traced_walk("search", word)
         current = self.root
         for letter in word:
             if letter not in current.children:
@@ -25,9 +100,563 @@ class Trie:
         return current.is_end_of_word
 
     def startsWith(self, prefix: str) -> bool:
+        if self.tracer is not None:
+            return self._traced_walk("startsWith", prefix)
         current = self.root
         for letter in prefix:
             if letter not in current.children:
                 return False
             current = current.children[letter]
         return True
+
+    def _trace_insert(self, word):
+        """Report the nodes insert() is about to visit or create."""
+        tracer = self.tracer
+        tracer.emit("call", "insert", word)
+        current = self.root
+        for letter in word:
+            current = current.children.get(letter) if current else None
+            tracer.emit("visit" if current else "insert", letter)
+
+    def _traced_walk(self, method, text):
+        """search() or startsWith(), reporting each letter to the tracer."""
+        tracer = self.tracer
+        tracer.emit("call", method, text)
+        current = self.root
+        for letter in text:
+            if letter not in current.children:
+                tracer.emit("result", False)
+                return False
+            current = current.children[letter]
+            tracer.emit("visit", letter)
+        found = current.is_end_of_word if method == "search" else True
+        tracer.emit("result", found)
+        return found
+
+    def _find(self, prefix):
+        current = self.root
+        for letter in prefix:
+            current = current.children.get(letter)
+            if current is None:
+                return None
+        return current
+
+    def count_prefix(self, prefix: str) -> int:
+        """Number of words starting with 'prefix', in O(len(prefix))."""
+        node = self._find(prefix)
+        return node.word_count if node is not None else 0
+
+    def top_k(self, prefix: str, k: int) -> list[str]:
+        """
+        The 'k' heaviest words starting with 'prefix', ties in alphabetical
+        order. Each node caches its best words, and insert() and delete() only
+        clear the caches along the changed word's path, so repeated queries
+        cost O(len(prefix) + k).
+        """
+        node = self._find(prefix)
+        if node is None or k <= 0:
+            return []
+        return [word for _, word in self._top(node, prefix, k)[:k]]
+
+    def _top(self, node, path, k):
+        top = node.top
+        if top is not None and (len(top) >= k or len(top) == node.word_count):
+            return top
+
+        candidates = [(-node.weight, path)] if node.is_end_of_word else []
+        for letter, child in node.children.items():
+            candidates.extend(self._top(child, path + letter, k))
+        node.top = heapq.nsmallest(k, candidates)
+        return node.top
+
+    def save(self, path) -> None:
+        """
+        Write the trie in the layout read by open_mmap(). Nodes are numbered
+        breadth first and the edges of node i are edges[edge_start[i]:
+        edge_start[i + 1]], sorted by letter:
+
+            header | edge_start[n + 1] | edge_label[e] | edge_target[e] | is_end[n]
+
+        The integer arrays are native-endian uint32 and the header records
+        the byte order, so the file is only portable between matching hosts.
+        """
+        edge_start = array("I", [0])
+        edge_label = array("I")
+        edge_target = array("I")
+        is_end = bytearray()
+
+        queue = deque([self.root])
+        next_id = 1
+        while queue:
+            node = queue.popleft()
+            is_end.append(node.is_end_of_word)
+            for letter in sorted(node.children):
+                edge_label.append(ord(letter))
+                edge_target.append(next_id)
+                next_id += 1
+                queue.append(node.children[letter])
+            edge_start.append(len(edge_label))
+
+        with open(path, "wb") as file:
+            file.write(
+                TRIE_FILE_HEADER.pack(
+                    TRIE_FILE_MAGIC, TRIE_FILE_VERSION, BYTE_ORDER_CHECK, len(is_end)
+                )
+            )
+            file.write(edge_start.tobytes())
+            file.write(edge_label.tobytes())
+            file.write(edge_target.tobytes())
+            file.write(is_end)
+
+    @staticmethod
+    def open_mmap(path) -> "MappedTrie":
+        """Open a file written by save() for read-only lookups."""
+        return MappedTrie(path)
+
+
+class TrieSnapshot(Trie):
+    """A read-only view of one version of a ConcurrentTrie."""
+
+    def __init__(self, root, version):
+        self.root = root
+        self.version = version
+
+    def insert(self, word: str, weight: int | None = None) -> None:
+        raise TypeError("Trie snapshots are read-only")
+
+    def delete(self, word: str) -> bool:
+        raise TypeError("Trie snapshots are read-only")
+
+
+class ConcurrentTrie(Trie):
+    """
+    Trie for one writer and many reader threads. Nodes are never changed
+    once published: insert() and delete() copy the nodes along the word's
+    path and then swap in the new root with a single assignment. A reader uses
+    whatever root it read when its lookup started, so lookups need no lock.
+    (top_k() does fill in node caches, but every reader computes the same
+    value for a node, so those writes are harmless.)
+    """
+
+    def __init__(self):
+        self._published = (TrieNode(), 0)  # (root, version), swapped together
+        self._write_lock = threading.Lock()
+
+    @property
+    def root(self):
+        return self._published[0]
+
+    @property
+    def version(self):
+        return self._published[1]
+
+    def snapshot(self) -> TrieSnapshot:
+        """A consistent view that later inserts do not affect."""
+        return TrieSnapshot(*self._published)
+
+    def insert(self, word: str, weight: int | None = None) -> None:
+        with self._write_lock:
+            old_root, version = self._published
+            is_new = not self.search(word)
+            if not is_new and weight is None:
+                return
+
+            new_root = self._copy(old_root)
+            old, new = old_root, new_root
+            for letter in word:
+                old = old.children.get(letter) if old is not None else None
+                child = self._copy(old) if old is not None else TrieNode()
+                new.children[letter] = child
+                new = child
+                if is_new:
+                    new.word_count += 1
+
+            if is_new:
+                new_root.word_count += 1
+                new.is_end_of_word = True
+                new.weight = 1 if weight is None else weight
+            else:
+                new.weight = weight
+
+            self._published = (new_root, version + 1)
+
+    def delete(self, word: str) -> bool:
+        with self._write_lock:
+            old_root, version = self._published
+            if not self.search(word):
+                return False
+
+            new_root = self._copy(old_root)
+            new_root.word_count -= 1
+            old, new = old_root, new_root
+            for letter in word:
+                old = old.children[letter]
+                if old.word_count == 1:
+                    # Only this word lives below here, drop the whole branch
+                    del new.children[letter]
+                    break
+                child = self._copy(old)
+                child.word_count -= 1
+                new.children[letter] = child
+                new = child
+            else:
+                new.is_end_of_word = False
+                new.weight = 0
+
+            self._published = (new_root, version + 1)
+            return True
+
+    @staticmethod
+    def _copy(node):
+        """A copy with the same children and no cached top_k results."""
+        copy = TrieNode()
+        copy.children = dict(node.children)
+        copy.is_end_of_word = node.is_end_of_word
+        copy.word_count = node.word_count
+        copy.weight = node.weight
+        return copy
+
+
+class AhoCorasick:
+    """
+    Finds every dictionary word inside a text in one pass. The failure and
+    output links live in dicts keyed by the Trie's own TrieNodes, so the trie
+    is used as is; it should not be changed after the automaton is built.
+    """
+
+    def __init__(self, trie: Trie):
+        self.root = trie.root
+        self.fail = {self.root: self.root}
+        self.output = {self.root: None}  # nearest word end along fail links
+        self.words = {}  # word-end node -> word
+
+        queue = deque([(self.root, "")])
+        while queue:
+            node, path = queue.popleft()
+            if node is not self.root:
+                if node.is_end_of_word:
+                    self.words[node] = path
+                fallback = self.fail[node]
+                self.output[node] = (
+                    fallback
+                    if fallback is not self.root and fallback.is_end_of_word
+                    else self.output[fallback]
+                )
+
+            for letter, child in node.children.items():
+                fallback = self.fail[node]
+                while fallback is not self.root and letter not in fallback.children:
+                    fallback = self.fail[fallback]
+                target = fallback.children.get(letter)
+                self.fail[child] = (
+                    target if target is not None and target is not child else self.root
+                )
+                queue.append((child, path + letter))
+
+    @classmethod
+    def from_words(cls, words) -> "AhoCorasick":
+        trie = Trie()
+        for word in words:
+            trie.insert(word)
+        return cls(trie)
+
+    def scan(self, text: str):
+        """Yield (offset, word) for every match in 'text', in order of end."""
+        return self.scan_chunks([text])
+
+    def scan_chunks(self, chunks):
+        """
+        Like scan(), over text split into chunks, e.g. a file read piece by
+        piece. Matches may span chunks and offsets count from the first one.
+        """
+        root, fail, output, words = self.root, self.fail, self.output, self.words
+        node = root
+        position = 0
+        for chunk in chunks:
+            for letter in chunk:
+                while node is not root and letter not in node.children:
+                    node = fail[node]
+                node = node.children.get(letter, root)
+
+                match = node if node in words else output[node]
+                while match is not None:
+                    word = words[match]
+                    yield position - len(word) + 1, word
+                    match = output[match]
+                position += 1
+
+    def scan_file(self, path, chunk_size=1 << 16, encoding="utf-8"):
+        """scan_chunks() over a text file read 'chunk_size' characters at a time."""
+        with open(path, encoding=encoding) as file:
+            yield from self.scan_chunks(iter(lambda: file.read(chunk_size), ""))
+
+
+class MappedTrie:
+    """
+    Read-only Trie over a memory-mapped file from Trie.save(). Opening only
+    reads the header; lookups binary search the edge arrays in place, and
+    processes that open the same file share its pages.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, order, nodes = TRIE_FILE_HEADER.unpack_from(self._mmap)
+        if magic != TRIE_FILE_MAGIC or version != TRIE_FILE_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a saved Trie")
+        if order != BYTE_ORDER_CHECK:
+            self._mmap.close()
+            raise ValueError(f"{path} was saved with a different byte order")
+
+        edges = nodes - 1
+        view = memoryview(self._mmap)
+        offset = TRIE_FILE_HEADER.size
+        self.edge_start = view[offset : offset + 4 * (nodes + 1)].cast("I")
+        offset += 4 * (nodes + 1)
+        self.edge_label = view[offset : offset + 4 * edges].cast("I")
+        offset += 4 * edges
+        self.edge_target = view[offset : offset + 4 * edges].cast("I")
+        offset += 4 * edges
+        self.is_end_of_word = view[offset : offset + nodes]
+
+    def _find(self, text):
+        edge_start, edge_label = self.edge_start, self.edge_label
+        node = 0
+        for letter in text:
+            code = ord(letter)
+            high = edge_start[node + 1]
+            edge = bisect_left(edge_label, code, edge_start[node], high)
+            if edge == high or edge_label[edge] != code:
+                return None
+            node = self.edge_target[edge]
+        return node
+
+    def search(self, word: str) -> bool:
+        node = self._find(word)
+        return node is not None and bool(self.is_end_of_word[node])
+
+    def startsWith(self, prefix: str) -> bool:
+        return self._find(prefix) is not None
+
+    def close(self) -> None:
+        for view in (
+            self.edge_start,
+            self.edge_label,
+            self.edge_target,
+            self.is_end_of_word,
+        ):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CompactTrie:
+    """
+    Same API as Trie, but nodes are ids into flat arrays instead of objects.
+    Children are a linked list: first_child[node] is the newest child and
+    next_sibling[child] the one added before it. Node 0 is the root, so 0
+    also means "no node". About 13 bytes per node.
+    """
+
+    def __init__(self):
+        self.first_child = array("I", [0])
+        self.next_sibling = array("I", [0])
+        self.label = array("I", [0])  # code point of the edge into the node
+        self.is_end_of_word = bytearray(1)
+
+    def __len__(self):
+        """Number of nodes, including the root."""
+        return len(self.label)
+
+    def _add_child(self, node, code):
+        child = len(self.label)
+        self.label.append(code)
+        self.first_child.append(0)
+        self.next_sibling.append(self.first_child[node])
+        self.is_end_of_word.append(0)
+        self.first_child[node] = child
+        return child
+
+    def _find(self, text):
+        first_child, next_sibling, label = (
+            self.first_child,
+            self.next_sibling,
+            self.label,
+        )
+        node = 0
+        for letter in text:
+            code = ord(letter)
+            node = first_child[node]
+            while node and label[node] != code:
+                node = next_sibling[node]
+            if not node:
+                return None
+        return node
+
+    def insert(self, word: str) -> None:
+        first_child, next_sibling, label = (
+            self.first_child,
+            self.next_sibling,
+            self.label,
+        )
+        node = 0
+        for letter in word:
+            code = ord(letter)
+            child = first_child[node]
+            while child and label[child] != code:
+                child = next_sibling[child]
+            if not child:
+                child = self._add_child(node, code)
+            node = child
+        self.is_end_of_word[node] = 1
+
+    def search(self, word: str) -> bool:
+        node = self._find(word)
+        return node is not None and bool(self.is_end_of_word[node])
+
+    def startsWith(self, prefix: str) -> bool:
+        return self._find(prefix) is not None
+
+    def bulk_load(self, words) -> None:
+        """
+        Insert every word from an iterable. For sorted input into an empty
+        trie, a word only shares the path it has in common with the previous
+        word, so the rest is appended without searching any children.
+        Unsorted input (or a non-empty trie) falls back to insert().
+        """
+        words = iter(words)
+        if len(self.label) > 1:
+            for word in words:
+                self.insert(word)
+            return
+
+        path = [0]  # node ids along the previous word
+        previous = ""
+        for word in words:
+            if word < previous:
+                self.insert(word)
+                break
+
+            common = 0
+            limit = min(len(word), len(previous))
+            while common < limit and word[common] == previous[common]:
+                common += 1
+
+            del path[common + 1 :]
+            node = path[common]
+            for letter in word[common:]:
+                node = self._add_child(node, ord(letter))
+                path.append(node)
+            self.is_end_of_word[node] = 1
+            previous = word
+
+        for word in words:
+            self.insert(word)
+
+
+class RadixNode:
+    __slots__ = ("children", "is_end_of_word", "label")
+
+    def __init__(self, label=""):
+        self.label = label  # the edge into this node, can be several letters
+        self.children = {}  # first letter of the child's label -> RadixNode
+        self.is_end_of_word = False
+
+
+class RadixTrie:
+    """
+    Same API as Trie, but chains of single-child nodes are merged into one
+    node whose edge label holds the whole chain.
+    """
+
+    def __init__(self):
+        self.root = RadixNode()
+
+    def insert(self, word: str) -> None:
+        current = self.root
+        i = 0
+        while i < len(word):
+            child = current.children.get(word[i])
+            if child is None:
+                leaf = RadixNode(word[i:])
+                leaf.is_end_of_word = True
+                current.children[word[i]] = leaf
+                return
+
+            label = child.label
+            if word.startswith(label, i):
+                common = len(label)
+            else:
+                # Split the edge where the word and the label part ways
+                common = 1
+                while i + common < len(word) and word[i + common] == label[common]:
+                    common += 1
+                middle = RadixNode(label[:common])
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                current.children[word[i]] = middle
+                child = middle
+
+            current = child
+            i += common
+        current.is_end_of_word = True
+
+    def _walk(self, text):
+        """
+        Follow 'text' from the root. Returns (node, rest) where 'rest' is the
+        part of node's label past the end of 'text', or None if 'text' is not
+        a prefix of any word.
+        """
+        current = self.root
+        i = 0
+        while i < len(text):
+            child = current.children.get(text[i])
+            if child is None:
+                return None
+            label = child.label
+            if text.startswith(label, i):
+                current = child
+                i += len(label)
+            elif label.startswith(text[i:]):
+                return child, label[len(text) - i :]
+            else:
+                return None
+        return current, ""
+
+    def search(self, word: str) -> bool:
+        found = self._walk(word)
+        return found is not None and not found[1] and found[0].is_end_of_word
+
+    def startsWith(self, prefix: str) -> bool:
+        return self._walk(prefix) is not None
+
+    def keys_with_prefix(self, prefix: str, limit=None):
+        """
+        Yield the words starting with 'prefix' in sorted order, at most
+        'limit' of them. Words are produced lazily, so only the part of the
+        trie needed for the first 'limit' results is visited.
+        """
+        found = self._walk(prefix)
+        if found is None or limit == 0:
+            return
+        node, rest = found
+
+        count = 0
+        stack = [(node, prefix + rest)]
+        while stack:
+            node, word = stack.pop()
+            if node.is_end_of_word:
+                yield word
+                count += 1
+                if count == limit:
+                    return
+            for letter in sorted(node.children, reverse=True):
+                child = node.children[letter]
+                stack.append((child, word + child.label))
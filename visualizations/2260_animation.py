@@ -1,3 +1,6 @@
+import importlib
+from typing import ClassVar
+
 from manim import (
     BLUE,
     DOWN,
@@ -19,8 +22,17 @@ from manim import (
     Write,
 )
 
+from scene_cases import CaseMixin
+from text_cache import NumberLabel, SetValue, cached_text
+from tracing import COMPARE, RESULT, STEP, UPDATE, VISIT, Trace
+
+# The real solution; "2260_solution" is not a valid name for an import statement
+Solution = importlib.import_module("2260_solution").Solution
+
+
+class MinConsecutiveCards(CaseMixin, Scene):
+    DEFAULT_CASE: ClassVar[dict] = {"cards": [3, 4, 2, 3, 4, 7]}
 
-class MinConsecutiveCards(Scene):
     def construct(self):
         # Title
         title = (
@@ -31,7 +43,7 @@ class MinConsecutiveCards(Scene):
         self.play(Write(title))
 
         # Example input
-        cards = [3, 4, 2, 3, 4, 7]
+        cards = self.inputs()["cards"]
 
         # 1) Display the input array (row of squares labeled with values)
         array_group = self.create_card_array(cards)
@@ -46,10 +58,10 @@ class MinConsecutiveCards(Scene):
         )
         self.play(Write(dict_header))
 
-        # We'll keep these:
-        #   seen_data: A plain Python dict tracking card -> last index
+        # Run the real solution once and replay its recorded steps:
         #   dict_entries: A map from card -> the Manim Text() line we show on screen
-        seen_data = {}
+        trace = Trace()
+        Solution().minimumCardPickup(cards, tracer=trace)
         dict_entries = {}
         dict_y_offset = (
             dict_header.get_center()[1] - 0.7
@@ -58,35 +70,38 @@ class MinConsecutiveCards(Scene):
         # For highlighting the current card
         highlight_rect = None
 
-        # Keep track of min_draws and a text object to show it
-        min_draws = float("inf")
+        # Show min_draws with a text object
         min_draws_title = Text("min_draws:", font_size=28).to_edge(RIGHT).shift(UP * 1)
         self.play(Write(min_draws_title))
-        min_draws_text = Text("∞", font_size=28)
+        min_draws_text = NumberLabel("∞", font_size=28)
         min_draws_text.next_to(min_draws_title, DOWN, buff=0.2)
         self.play(Write(min_draws_text))
 
         # We'll store references for subarray highlights so we can fade them out
         current_subarray_highlight = None
 
-        # 2) Iterate through cards
-        for i, card_val in enumerate(cards):
-            # Highlight the current square
-            if highlight_rect:
-                self.play(FadeOut(highlight_rect))
-            current_card_mobj = array_group[
-                2 * i
-            ]  # squares at even indices in the group
-            highlight_rect = SurroundingRectangle(
-                current_card_mobj, color=BLUE, buff=0.05
-            )
-            self.play(Create(highlight_rect))
-
-            # If we've seen this card before, compute distance
-            if card_val in seen_data:
-                # subarray size is (i - seen[card_val] + 1)
-                prev_index = seen_data[card_val]
-                draws = i - prev_index + 1
+        # 2) Replay the trace
+        for kind, args in trace:
+            if kind == STEP:
+                # Marks where each card's events start; nothing to show
+                pass
+
+            elif kind == VISIT:
+                # Highlight the current square
+                i, card_val = args
+                if highlight_rect:
+                    self.play(FadeOut(highlight_rect))
+                current_card_mobj = array_group[
+                    2 * i
+                ]  # squares at even indices in the group
+                highlight_rect = SurroundingRectangle(
+                    current_card_mobj, color=BLUE, buff=0.05
+                )
+                self.play(Create(highlight_rect))
+
+            elif kind == COMPARE:
+                # We've seen this card before at prev_index
+                prev_index, i = args
 
                 # If we have a leftover highlight from the previous match, remove it
                 if current_subarray_highlight:
@@ -101,41 +116,41 @@ class MinConsecutiveCards(Scene):
                 )
                 self.play(Create(current_subarray_highlight))
 
-                # Update min_draws if needed
-                if draws < min_draws:
-                    min_draws = draws
-                    # Animate changing text from the old value to new
-                    new_min_text = Text(str(min_draws), font_size=28)
-                    new_min_text.move_to(min_draws_text.get_center())
-                    self.play(Transform(min_draws_text, new_min_text))
-
-            # Update "seen" dictionary with the current card index
-            seen_data[card_val] = i
-
-            # Update or create a dictionary entry text on the right
-            if card_val not in dict_entries:
-                # new line
-                entry_str = f"{card_val}: {i}"
-                entry_text = Text(entry_str, font_size=26)
-                entry_text.move_to([-2.5, dict_y_offset, 0])
-                self.play(Write(entry_text))
-                dict_entries[card_val] = entry_text
-                dict_y_offset -= 0.5
+            elif kind == UPDATE and args[0] == "min_draws":
+                # Animate changing text from the old value to new
+                self.play(SetValue(min_draws_text, args[2]))
+
+            elif kind == UPDATE and args[0] == "seen":
+                # Update or create a dictionary entry text on the right
+                _, card_val, i = args
+                if card_val not in dict_entries:
+                    # new line
+                    entry_str = f"{card_val}: {i}"
+                    entry_text = cached_text(entry_str, font_size=26)
+                    entry_text.move_to([-2.5, dict_y_offset, 0])
+                    self.play(Write(entry_text))
+                    dict_entries[card_val] = entry_text
+                    dict_y_offset -= 0.5
+                else:
+                    # transform the existing line
+                    old_text = dict_entries[card_val]
+                    new_line_str = f"{card_val}: {i}"
+                    new_text_mobj = cached_text(new_line_str, font_size=26)
+                    new_text_mobj.move_to(old_text.get_center())
+                    self.play(Transform(old_text, new_text_mobj))
+
+            elif kind == RESULT:
+                min_draws = args[0]
+
             else:
-                # transform the existing line
-                old_text = dict_entries[card_val]
-                new_line_str = f"{card_val}: {i}"
-                new_text_mobj = Text(new_line_str, font_size=26)
-                new_text_mobj.move_to(old_text.get_center())
-                self.play(Transform(old_text, new_text_mobj))
-                dict_entries[card_val] = new_text_mobj
+                raise ValueError(f"cannot replay {kind} event {args}")
 
         # Remove the final highlight
         if highlight_rect:
             self.play(FadeOut(highlight_rect))
 
         # 3) Show the final result
-        if min_draws == float("inf"):
+        if min_draws == -1:
             result_str = "No matching cards found. (-1)"
         else:
             result_str = f"Minimum subarray length = {min_draws}"
@@ -158,7 +173,7 @@ class MinConsecutiveCards(Scene):
         for i, val in enumerate(cards):
             square = Square(side_length=0.6)
             square.shift(RIGHT * i * 1.1)
-            text = Text(str(val), font_size=24).move_to(square.get_center())
+            text = cached_text(str(val), font_size=24).move_to(square.get_center())
             group.add(square, text)
 
         group.move_to(ORIGIN)
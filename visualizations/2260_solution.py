@@ -1,17 +1,133 @@
 from collections import defaultdict
-from typing import List
+from collections.abc import Callable, Iterable, Iterator
+
+import numpy as np
+
+# Lists at least this long are converted to an array and searched with NumPy
+ARRAY_MIN_SIZE = 1 << 12
+# Default number of bytes (text) or values (binary) read at a time by iter_cards
+CHUNK_SIZE = 1 << 16
 
 
 class Solution:
-    def minimumCardPickup(self, cards: List[int]) -> int:
+    def minimumCardPickup(
+        self,
+        cards: Iterable[int],
+        on_update: Callable[[int, int], None] | None = None,
+        tracer=None,
+    ) -> int:
+        """
+        'cards' can be any iterable, e.g. iter_cards() over a file, and is
+        read once. on_update(index, draws) is called whenever a closer pair is
+        found. A pair of adjacent cards cannot be beaten, so that stops early.
+        'tracer' is an optional tracing.Trace that records every step, with
+        a 'step' event per card, so Trace.sample() can pick cards to show.
+        """
+        if (
+            on_update is None
+            and tracer is None
+            and (
+                isinstance(cards, np.ndarray)
+                or (isinstance(cards, list) and len(cards) >= ARRAY_MIN_SIZE)
+            )
+        ):
+            array = np.asarray(cards)
+            if array.ndim == 1 and array.dtype.kind in "iu":
+                return minimum_card_pickup_array(array)
+
         seen = defaultdict(int)
         min_draws = float("inf")
 
         for i, card in enumerate(cards):
+            if tracer is not None:
+                tracer.emit("step", i)
+                tracer.emit("visit", i, card)
             if card in seen:
                 draws = i - seen[card] + 1
-                min_draws = min(min_draws, draws)
+                if tracer is not None:
+                    tracer.emit("compare", seen[card], i)
+                if draws < min_draws:
+                    min_draws = draws
+                    if tracer is not None:
+                        tracer.emit("update", "min_draws", None, draws)
+                    if on_update is not None:
+                        on_update(i, draws)
+                    if draws == 2:
+                        break
 
             seen[card] = i
+            if tracer is not None:
+                tracer.emit("update", "seen", card, i)
+
+        result = min_draws if min_draws < float("inf") else -1
+        if tracer is not None:
+            tracer.emit("result", result)
+        return result
+
+
+def iter_cards(path, chunk_size: int = CHUNK_SIZE, dtype=None) -> Iterator[int]:
+    """
+    Stream the cards in a file, reading 'chunk_size' units at a time. Without
+    'dtype' the file holds whitespace-separated integers; with one it is raw
+    binary of that dtype, as written by ndarray.tofile().
+    """
+    if dtype is not None:
+        itemsize = np.dtype(dtype).itemsize
+        with open(path, "rb") as file:
+            while chunk := file.read(chunk_size * itemsize):
+                yield from np.frombuffer(chunk, dtype=dtype).tolist()
+        return
+
+    with open(path, "rb") as file:
+        partial = b""
+        while chunk := file.read(chunk_size):
+            tokens = (partial + chunk).split()
+            # The last token may continue in the next chunk
+            partial = b"" if chunk[-1:].isspace() else tokens.pop()
+            yield from map(int, tokens)
+        if partial:
+            yield int(partial)
+
+
+def minimum_card_pickup_file(
+    path,
+    chunk_size: int = CHUNK_SIZE,
+    dtype=None,
+    on_update: Callable[[int, int], None] | None = None,
+) -> int:
+    """minimumCardPickup over a card file that may not fit in memory."""
+    cards = iter_cards(path, chunk_size, dtype)
+    return Solution().minimumCardPickup(cards, on_update)
+
+
+def minimum_card_pickup_array(cards: np.ndarray) -> int:
+    """
+    minimumCardPickup for a 1D integer array. A stable argsort lists the
+    positions of each value in order, so the closest pair of equal cards is
+    the smallest gap between neighbours with the same value. Values are
+    shifted to start at zero and narrowed to the smallest unsigned type
+    first, which lets NumPy use radix sort for ranges up to 2**16.
+    """
+    if len(cards) < 2:
+        return -1
+    keys = _narrow(cards)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    same = sorted_keys[1:] == sorted_keys[:-1]
+    if not same.any():
+        return -1
+    gaps = np.diff(order)[same]
+    return int(gaps.min()) + 1
+
 
-        return min_draws if min_draws < float("inf") else -1
+def _narrow(cards):
+    """Shift values to start at zero, in the smallest unsigned type that fits."""
+    low = int(cards.min())
+    span = int(cards.max()) - low
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if span <= np.iinfo(dtype).max:
+            break
+    if low == 0 and cards.dtype == dtype:
+        return cards
+    return (cards - cards.dtype.type(low)).astype(dtype)
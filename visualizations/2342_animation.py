@@ -1,7 +1,20 @@
+import importlib
+from typing import ClassVar
+
 from manim import *
 
+from coalesce import CoalescingMixin
+from scene_cases import CaseMixin
+from text_cache import NumberLabel, SetValue, cached_text
+
+# The real solution; "2342_solution" is not a valid name for an import statement
+digit_sum = importlib.import_module("2342_solution").digit_sum
+
+
+class MaxSumOfAPairWithEqualSumOfDigits(CaseMixin, CoalescingMixin, Scene):
+    # Example input: adjust as you wish
+    DEFAULT_CASE: ClassVar[dict] = {"nums": [51, 71, 17, 42]}
 
-class MaxSumOfAPairWithEqualSumOfDigits(Scene):
     def construct(self):
         # Title
         title = (
@@ -11,8 +24,8 @@ class MaxSumOfAPairWithEqualSumOfDigits(Scene):
         )
         self.play(Write(title))
 
-        # Example input: adjust as you wish
-        nums = [51, 71, 17, 42]
+        # Example input
+        nums = self.inputs()["nums"]
 
         ###################################################################
         # 1) Display the input array
@@ -38,7 +51,7 @@ class MaxSumOfAPairWithEqualSumOfDigits(Scene):
         dict_entries = (
             VGroup()
         )  # We'll store all lines in a VGroup for easier positioning
-        self.add(dict_entries)  # Add it to the scene so we can keep building below
+        # Not added to the scene: each line's Write() adds it when it is drawn
 
         ###################################################################
         # 3) max_sum text display on the right side
@@ -48,7 +61,7 @@ class MaxSumOfAPairWithEqualSumOfDigits(Scene):
         self.play(Write(max_sum_header))
 
         max_sum_val = -1
-        max_sum_text = Text(str(max_sum_val), font_size=28)
+        max_sum_text = NumberLabel(max_sum_val, font_size=28)
         max_sum_text.next_to(max_sum_header, DOWN, buff=0.2)
         self.play(Write(max_sum_text))
 
@@ -58,41 +71,42 @@ class MaxSumOfAPairWithEqualSumOfDigits(Scene):
         highlight_rect = None
 
         for i, num in enumerate(nums):
-            # Highlight the current square
-            if highlight_rect:
-                self.play(FadeOut(highlight_rect))
-            current_square = array_group[2 * i]
-            highlight_rect = SurroundingRectangle(current_square, color=BLUE, buff=0.05)
-            self.play(Create(highlight_rect))
-
-            # Show digit sum
-            ds = self.get_digit_sum(num)
-            ds_text = Text(f"digit_sum({num}) = {ds}", font_size=24).next_to(
-                current_square, DOWN
-            )
-            self.play(Write(ds_text))
-            self.wait(0.6)
-            self.play(FadeOut(ds_text))
-
-            # If we already have a number with this digit sum, check potential new sum
-            if ds in sums_dict:
-                old_num = sums_dict[ds]
-                cur_sum = old_num + num
-                if cur_sum > max_sum_val:
-                    max_sum_val = cur_sum
-                    new_max_sum_text = Text(str(max_sum_val), font_size=28).move_to(
-                        max_sum_text.get_center()
-                    )
-                    self.play(Transform(max_sum_text, new_max_sum_text))
-
-                # Update dictionary to store the larger number if this num is bigger
-                if num > sums_dict[ds]:
+            # One play per number for its highlights and updates
+            with self.coalesced():
+                # Highlight the current square
+                if highlight_rect:
+                    self.play(FadeOut(highlight_rect))
+                current_square = array_group[2 * i]
+                highlight_rect = SurroundingRectangle(
+                    current_square, color=BLUE, buff=0.05
+                )
+                self.play(Create(highlight_rect))
+
+                # Show digit sum
+                ds = digit_sum(num)
+                ds_text = Text(f"digit_sum({num}) = {ds}", font_size=24).next_to(
+                    current_square, DOWN
+                )
+                self.play(Write(ds_text))
+                self.wait(0.6)
+                self.play(FadeOut(ds_text))
+
+                # If we already have a number with this digit sum, check potential new sum
+                if ds in sums_dict:
+                    old_num = sums_dict[ds]
+                    cur_sum = old_num + num
+                    if cur_sum > max_sum_val:
+                        max_sum_val = cur_sum
+                        self.play(SetValue(max_sum_text, max_sum_val))
+
+                    # Update dictionary to store the larger number if this num is bigger
+                    if num > sums_dict[ds]:
+                        sums_dict[ds] = num
+                        self.update_dict_line(dict_header, dict_entries, ds, num)
+                else:
                     sums_dict[ds] = num
-                    self.update_dict_line(dict_header, dict_entries, ds, num)
-            else:
-                sums_dict[ds] = num
-                # Create a new line under the dictionary heading
-                self.create_dict_line(dict_header, dict_entries, ds, num)
+                    # Create a new line under the dictionary heading
+                    self.create_dict_line(dict_header, dict_entries, ds, num)
 
         # Remove highlight
         if highlight_rect:
@@ -121,22 +135,18 @@ class MaxSumOfAPairWithEqualSumOfDigits(Scene):
         for i, val in enumerate(nums):
             square = Square(side_length=0.6)
             square.shift(RIGHT * i * 1.1)
-            text = Text(str(val), font_size=24).move_to(square.get_center())
+            text = cached_text(str(val), font_size=24).move_to(square.get_center())
             group.add(square, text)
         group.move_to(ORIGIN)
         return group
 
-    def get_digit_sum(self, num):
-        """Return the sum of digits of num."""
-        return sum(int(d) for d in str(num))
-
     def create_dict_line(self, dict_header, dict_entries, ds, val):
         """
         Create a new dictionary line "ds -> val" below the existing dictionary lines,
         starting below dict_header.
         """
         entry_str = f"{ds} -> {val}"
-        new_line = Text(entry_str, font_size=24)
+        new_line = cached_text(entry_str, font_size=24)
         # If there are no existing entries, place it under dict_header
         if len(dict_entries) == 0:
             new_line.next_to(dict_header, DOWN, buff=0.3)
@@ -158,7 +168,7 @@ class MaxSumOfAPairWithEqualSumOfDigits(Scene):
             if line.text.startswith(f"{ds} ->"):
                 old_line = line
                 new_line_str = f"{ds} -> {val}"
-                new_line = Text(new_line_str, font_size=24)
+                new_line = cached_text(new_line_str, font_size=24)
                 new_line.move_to(old_line.get_center())
                 self.play(Transform(old_line, new_line))
                 return
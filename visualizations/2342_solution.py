@@ -1,21 +1,75 @@
 from collections import defaultdict
 from typing import List
 
+import numpy as np
+
 
 class Solution:
     def maximumSum(self, nums: List[int]) -> int:
-        def get_digit_sum(num):
-            return sum(int(digit) for digit in str(num))
+        if isinstance(nums, np.ndarray):
+            return maximum_sum_array(nums)
 
         sums = defaultdict(int)
         max_sum = -1
         for num in nums:
-            digit_sum = get_digit_sum(num)
+            ds = digit_sum(num)
 
-            if digit_sum in sums:
-                cur_sum = sums[digit_sum] + num
+            if ds in sums:
+                cur_sum = sums[ds] + num
                 max_sum = max(max_sum, cur_sum)
 
-            sums[digit_sum] = max(sums[digit_sum], num)
+            sums[ds] = max(sums[ds], num)
 
         return max_sum
+
+
+def digit_sum(num: int) -> int:
+    if num < 0:
+        raise ValueError(f"maximumSum needs non-negative integers, got {num}")
+    total = 0
+    while num:
+        num, digit = divmod(num, 10)
+        total += digit
+    return total
+
+
+def digit_sums(nums: np.ndarray) -> np.ndarray:
+    """Digit sum of every element of a non-negative integer array."""
+    rest = nums.astype(np.int64)
+    # Negative values, or uint64 values that wrapped in the cast, would never
+    # reach zero
+    if (rest < 0).any():
+        raise ValueError("maximumSum needs non-negative integers below 2**63")
+    sums = np.zeros(len(rest), dtype=np.int64)
+    while rest.any():
+        sums += rest % 10
+        rest //= 10
+    return sums
+
+
+def maximum_sum_array(nums: np.ndarray) -> int:
+    """
+    maximumSum for a 1D array of non-negative integers. Digit sums are
+    computed for the whole array at once, then each digit-sum group keeps
+    its largest and second largest value with two grouped maximum reductions.
+    """
+    nums = nums.astype(np.int64)
+    sums = digit_sums(nums)
+    if len(nums) < 2:
+        return -1
+    groups = int(sums.max()) + 1
+
+    largest = np.full(groups, -1, dtype=np.int64)
+    np.maximum.at(largest, sums, nums)
+
+    # The largest value may appear more than once in its group
+    is_largest = nums == largest[sums]
+    second = np.full(groups, -1, dtype=np.int64)
+    np.maximum.at(second, sums[~is_largest], nums[~is_largest])
+    repeated = np.bincount(sums[is_largest], minlength=groups) > 1
+    second[repeated] = largest[repeated]
+
+    pairs = second >= 0
+    if not pairs.any():
+        return -1
+    return int((largest[pairs] + second[pairs]).max())
@@ -1,9 +1,192 @@
+import mmap
+import os
 from collections import Counter
+from math import isqrt, prod
 from typing import List
 
+import numpy as np
+
+# Odd multiplier for the polynomial row/column fingerprints
+HASH_BASE = np.uint64(0x9E3779B97F4A7C15)
+# Cells read at a time while fingerprinting or verifying, which bounds the
+# extra memory used for grids of any size
+BLOCK_CELLS = 1 << 22
+# Bytes a read fault can map in: Linux maps up to 16 pages around the faulting
+# one when they are in the page cache (fault_around_bytes)
+FAULT_BYTES = max(mmap.PAGESIZE, 1 << 16)
+
 
 class Solution:
     def equalPairs(self, grid: List[List[int]]) -> int:
+        if isinstance(grid, np.ndarray):
+            return equal_pairs_array(grid)
+
         row_count = Counter(tuple(row) for row in grid)
         col_count = Counter(col for col in zip(*grid))
-        return sum(row_count[key] * col_count[key] for key in row_count)
\ No newline at end of file
+        return sum(row_count[key] * col_count[key] for key in row_count)
+
+
+def equal_pairs_array(
+    grid: np.ndarray, block_cells: int = BLOCK_CELLS, mapping=None
+) -> int:
+    """
+    equalPairs for a 2D integer NumPy array, including a memory-mapped one.
+    Rows and columns are reduced to 64-bit polynomial fingerprints, one
+    stripe of rows at a time, and matched by fingerprint. Every match is then
+    checked against the real values, so a hash collision cannot change the
+    answer. Besides the O(n) fingerprints, at most about 'block_cells' cells
+    are held in memory at once. 'mapping' is a read-only mmap.mmap holding
+    the grid, as made by equal_pairs_file(); its pages are dropped from this
+    process as it is read. Other grids, such as a caller's memmap, are never
+    released, as that could throw away their copy-on-write edits.
+    """
+    n_rows, n_cols = grid.shape
+    if n_rows != n_cols or n_rows == 0:
+        return 0
+
+    row_hash, col_hash = _fingerprints(grid, block_cells, mapping)
+
+    rows = np.flatnonzero(np.isin(row_hash, col_hash))
+    cols = np.flatnonzero(np.isin(col_hash, row_hash))
+    if len(rows) == 0:
+        return 0
+
+    # The first row with each fingerprint stands in for its group
+    groups, first = np.unique(row_hash[rows], return_index=True)
+    row_group = np.searchsorted(groups, row_hash[rows])
+    col_group = np.searchsorted(groups, col_hash[cols])
+    representative = rows[first]
+
+    # Representatives trivially match themselves, so only check the others
+    row_rep = representative[row_group]
+    row_ok = np.ones(len(rows), dtype=bool)
+    others = rows != row_rep
+    row_ok[others] = _rows_equal(
+        grid, rows[others], row_rep[others], block_cells, mapping
+    )
+    col_ok = _cols_equal(grid, cols, representative[col_group], block_cells, mapping)
+
+    rows_per_group = np.bincount(row_group[row_ok], minlength=len(groups))
+    cols_per_group = np.bincount(col_group[col_ok], minlength=len(groups))
+    total = int(rows_per_group @ cols_per_group)
+
+    # A row that differs from its representative can only equal a column
+    # that differs from it too, so count those leftovers exactly
+    bad_rows = rows[~row_ok]
+    bad_cols = cols[~col_ok]
+    if len(bad_rows) and len(bad_cols):
+        row_count = Counter(tuple(grid[r].tolist()) for r in bad_rows)
+        col_count = Counter(tuple(grid[:, c].tolist()) for c in bad_cols)
+        total += sum(row_count[key] * col_count[key] for key in row_count)
+    return total
+
+
+def load_grid(path, dtype=None, shape=None) -> np.ndarray:
+    """
+    Memory-map a grid file without reading it. '.npy' files carry their own
+    dtype and shape. Raw files need 'dtype', and are assumed square when
+    'shape' is not given.
+    """
+    return _map_grid(path, dtype, shape)[0]
+
+
+def _map_grid(path, dtype, shape):
+    """load_grid(), also returning the read-only mmap.mmap it created."""
+    offset, order = 0, "C"
+    if str(path).endswith(".npy"):
+        with open(path, "rb") as file:
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(file)
+            else:
+                header = np.lib.format.read_array_header_2_0(file)
+            offset = file.tell()
+        shape, fortran_order, dtype = header
+        order = "F" if fortran_order else "C"
+    elif dtype is None:
+        raise ValueError("raw grid files need a dtype")
+    elif shape is None:
+        n = isqrt(os.path.getsize(path) // np.dtype(dtype).itemsize)
+        shape = (n, n)
+
+    with open(path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    cells = np.frombuffer(mapping, dtype=dtype, count=prod(shape), offset=offset)
+    return cells.reshape(shape, order=order), mapping
+
+
+def equal_pairs_file(path, dtype=None, shape=None) -> int:
+    """equalPairs for a grid stored in a '.npy' or raw binary file."""
+    grid, mapping = _map_grid(path, dtype, shape)
+    return equal_pairs_array(grid, mapping=mapping)
+
+
+def _fingerprints(grid, block_cells, mapping):
+    """Row and column fingerprints, reading 'block_cells' cells at a time."""
+    n = grid.shape[0]
+    powers = np.cumprod(np.full(n, HASH_BASE, dtype=np.uint64))
+    row_hash = np.empty(n, dtype=np.uint64)
+    col_hash = np.zeros(n, dtype=np.uint64)
+
+    step = max(1, block_cells // n)
+    for start in range(0, n, step):
+        stop = start + step
+        stripe = _as_uint64(np.asarray(grid[start:stop]))
+        row_hash[start:stop] = stripe @ powers
+        col_hash += powers[start:stop] @ stripe
+        _release(mapping)
+    return row_hash, col_hash
+
+
+def _as_uint64(block):
+    """Reinterpret 64-bit integers in place, widen anything narrower."""
+    if block.dtype.kind in "iu" and block.dtype.itemsize == 8:
+        return block.view(np.uint64)
+    return block.astype(np.uint64)
+
+
+def _rows_equal(grid, rows, others, block_cells, mapping):
+    """For each i, whether grid[rows[i]] equals grid[others[i]]."""
+    step = max(1, block_cells // grid.shape[1])
+    equal = np.empty(len(rows), dtype=bool)
+    for start in range(0, len(rows), step):
+        stop = start + step
+        same = grid[rows[start:stop]] == grid[others[start:stop]]
+        equal[start:stop] = same.all(axis=1)
+        _release(mapping)
+    return equal
+
+
+def _cols_equal(grid, cols, rows, block_cells, mapping):
+    """
+    For each i, whether column cols[i] equals row rows[i]. Reads the grid
+    once, a stripe of rows at a time: column c over rows [start, stop) is
+    compared with its row's cells in columns [start, stop). Each of those
+    row pieces maps pages of its own, so they are gathered in batches that
+    map at most about 'block_cells' cells.
+    """
+    n = grid.shape[0]
+    step = max(1, block_cells // n)
+    fault_cells = FAULT_BYTES // grid.itemsize
+    batch = max(1, block_cells // (step + fault_cells))
+    equal = np.ones(len(cols), dtype=bool)
+    for start in range(0, n, step):
+        stop = start + step
+        column_part = np.asarray(grid[start:stop])[:, cols]
+        _release(mapping)
+        for first in range(0, len(cols), batch):
+            last = first + batch
+            row_part = grid[rows[first:last], start:stop]
+            same = column_part[:, first:last] == row_part.T
+            equal[first:last] &= same.all(axis=0)
+            _release(mapping)
+    return equal
+
+
+def _release(mapping):
+    """
+    Drop the pages of a read-only grid mapping from this process, so reading
+    the whole file does not grow the resident set. They stay in the page cache.
+    """
+    if mapping is not None and hasattr(mmap, "MADV_DONTNEED"):
+        mapping.madvise(mmap.MADV_DONTNEED)
@@ -1,17 +1,27 @@
 from collections import Counter
+from typing import ClassVar
 
 from manim import *
 
+from coalesce import CoalescingMixin
+from scene_cases import CaseMixin
+from text_cache import NumberLabel, SetValue, cached_text
+
+
+class CanConstructExplanation(CaseMixin, CoalescingMixin, Scene):
+    # Another example: {"ransom_note": "leet", "magazine": "lleeet"}
+    DEFAULT_CASE: ClassVar[dict] = {
+        "ransom_note": "bg",
+        "magazine": "efjbdfbdgfjhhaiigfhbaeja",
+    }
 
-class CanConstructExplanation(Scene):
     def construct(self):
         ###################################################################
         # 1) Example strings
         ###################################################################
-        # ransom_note = "leet"
-        ransom_note = "bg"
-        # magazine = "lleeet"  # repeated letters: l ->2, e->3, t->1
-        magazine = "efjbdfbdgfjhhaiigfhbaeja"
+        case = self.inputs()
+        ransom_note = case["ransom_note"]
+        magazine = case["magazine"]
 
         ###################################################################
         # 2) Title
@@ -71,37 +81,37 @@ class CanConstructExplanation(Scene):
             letter_text = ransom_squares[2 * i + 1]  # text inside that square
             letter = letter_text.text
 
-            # 5a) Highlight the current Ransom Note letter in BLUE
-            if highlight_rnote:
-                self.play(FadeOut(highlight_rnote))
-            highlight_rnote = SurroundingRectangle(r_sq, color=BLUE, buff=0.1)
-            self.play(Create(highlight_rnote))
-
-            # If magazine doesn't have enough of this letter, fail
-            if mag_counter[letter] == 0:
-                fail_box = SurroundingRectangle(letter_text, color=RED, buff=0.1)
-                self.play(Create(fail_box))
-                self.wait(1)
-                self.play(FadeOut(fail_box))
-                break  # or show some "Cannot Construct" message
-            else:
-                # Decrement
-                old_count = mag_counter[letter]
-                mag_counter[letter] -= 1
-                new_count = mag_counter[letter]
-
-                # 5b) Highlight the magazine square for that letter in YELLOW
-                if letter in mag_map:
-                    sq, l_txt, cnt_txt = mag_map[letter]
-                    mag_high = SurroundingRectangle(sq, color=YELLOW, buff=0.1)
-                    self.play(Create(mag_high))
-
-                    # Animate transforming the count text
-                    new_cnt_mobj = Text(str(new_count), font_size=20)
-                    new_cnt_mobj.move_to(cnt_txt.get_center())
-                    self.play(Transform(cnt_txt, new_cnt_mobj))
-
-                    self.play(FadeOut(mag_high))
+            # One play per letter for its highlights and count update
+            with self.coalesced():
+                # 5a) Highlight the current Ransom Note letter in BLUE
+                if highlight_rnote:
+                    self.play(FadeOut(highlight_rnote))
+                highlight_rnote = SurroundingRectangle(r_sq, color=BLUE, buff=0.1)
+                self.play(Create(highlight_rnote))
+
+                # If magazine doesn't have enough of this letter, fail
+                if mag_counter[letter] == 0:
+                    fail_box = SurroundingRectangle(letter_text, color=RED, buff=0.1)
+                    self.play(Create(fail_box))
+                    self.wait(1)
+                    self.play(FadeOut(fail_box))
+                    break  # or show some "Cannot Construct" message
+                else:
+                    # Decrement
+                    old_count = mag_counter[letter]
+                    mag_counter[letter] -= 1
+                    new_count = mag_counter[letter]
+
+                    # 5b) Highlight the magazine square for that letter in YELLOW
+                    if letter in mag_map:
+                        sq, l_txt, cnt_txt = mag_map[letter]
+                        mag_high = SurroundingRectangle(sq, color=YELLOW, buff=0.1)
+                        self.play(Create(mag_high))
+
+                        # Animate transforming the count text
+                        self.play(SetValue(cnt_txt, new_count))
+
+                        self.play(FadeOut(mag_high))
 
         # Remove last highlight
         if highlight_rnote:
@@ -135,7 +145,7 @@ class CanConstructExplanation(Scene):
         for i, ch in enumerate(text_str):
             sq = Square(side_length=0.6)
             sq.shift(RIGHT * i * buff)
-            txt = Text(ch, font_size=24).move_to(sq.get_center())
+            txt = cached_text(ch, font_size=24).move_to(sq.get_center())
             group.add(sq, txt)
         group.move_to(ORIGIN)
         return group
@@ -163,8 +173,8 @@ class CanConstructExplanation(Scene):
             sq.shift(RIGHT * i * buff)
 
             # Two texts: letter on top, count below
-            letter_mobj = Text(letter, font_size=24)
-            count_mobj = Text(str(count), font_size=20, color=WHITE)
+            letter_mobj = cached_text(letter, font_size=24)
+            count_mobj = NumberLabel(count, font_size=20, color=WHITE)
 
             # Position them inside the square
             letter_mobj.move_to(sq.get_top() - UP * 0.3)
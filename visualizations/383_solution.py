@@ -1,4 +1,13 @@
 from collections import Counter
+from collections.abc import Iterable
+from itertools import batched
+
+import numpy as np
+
+# From this magazine length, canConstruct compares byte histograms instead
+BYTES_MIN_SIZE = 1 << 12
+# Notes compared per vectorized step in MagazineIndex.can_construct_many
+CHUNK_NOTES = 4096
 
 
 class Solution:
@@ -7,11 +16,88 @@ class Solution:
         if len(ransomNote) > len(magazine):
             return False
 
-        magazine_counts = Counter(magazine)
+        if len(magazine) >= BYTES_MIN_SIZE:
+            return MagazineIndex(magazine).can_construct(ransomNote)
+
+        return can_construct_counter(ransomNote, magazine)
+
+
+def can_construct_counter(ransomNote: str, magazine: str) -> bool:
+    """canConstruct by counting the magazine's letters, for any length."""
+    if len(ransomNote) > len(magazine):
+        return False
+
+    magazine_counts = Counter(magazine)
+
+    for letter in ransomNote:
+        if not magazine_counts[letter]:
+            return False
+        magazine_counts[letter] -= 1
+
+    return True
+
+
+class MagazineIndex:
+    """
+    canConstruct for many notes against one magazine, which is counted only
+    once. Latin-1 magazines are kept as a 256-entry count array and notes are
+    compared with NumPy; any other magazine falls back to a Counter.
+    """
+
+    def __init__(self, magazine: str):
+        self.length = len(magazine)
+        self.counts = _byte_histogram(magazine)
+        self.counter = Counter(magazine) if self.counts is None else None
+
+    def can_construct(self, note: str) -> bool:
+        if len(note) > self.length:
+            return False
+        if self.counter is not None:
+            needed = Counter(note)
+            return all(self.counter[letter] >= n for letter, n in needed.items())
+
+        needed = _byte_histogram(note)
+        # A letter outside Latin-1 cannot be in a Latin-1 magazine
+        return needed is not None and bool((needed <= self.counts).all())
+
+    def can_construct_many(
+        self, notes: Iterable[str], chunk_size: int = CHUNK_NOTES
+    ) -> np.ndarray:
+        """can_construct for every note, as a boolean array."""
+        if self.counter is not None:
+            return np.fromiter(map(self.can_construct, notes), dtype=bool)
+
+        parts = [
+            self._can_construct_chunk(chunk) for chunk in batched(notes, chunk_size)
+        ]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=bool)
+
+    def _can_construct_chunk(self, notes):
+        """
+        One histogram per note from a single bincount: each byte is counted
+        in the 256 bins that belong to its note.
+        """
+        data = []
+        lengths = np.zeros(len(notes), dtype=np.int64)
+        encodable = np.ones(len(notes), dtype=bool)
+        for i, note in enumerate(notes):
+            try:
+                data.append(note.encode("latin-1"))
+                lengths[i] = len(note)
+            except UnicodeEncodeError:
+                encodable[i] = False
+
+        letters = np.frombuffer(b"".join(data), dtype=np.uint8)
+        owner = np.repeat(np.arange(len(notes)), lengths)
+        needed = np.bincount(owner * 256 + letters, minlength=len(notes) * 256)
+        fits = (needed.reshape(len(notes), 256) <= self.counts).all(axis=1)
+        return fits & encodable & (lengths <= self.length)
 
-        for letter in ransomNote:
-            if not magazine_counts[letter]:
-                return False
-            magazine_counts[letter] -= 1
 
-        return True
+def _byte_histogram(text: str) -> np.ndarray | None:
+    """Count of each character of a Latin-1 string, or None for other text."""
+    try:
+        data = text.encode("latin-1")
+    except UnicodeEncodeError:
+        return None
+    return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
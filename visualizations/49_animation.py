@@ -1,25 +1,32 @@
+from typing import ClassVar
+
 from manim import *
 
-class GroupAnagrams(Scene):
+from scene_cases import CaseMixin
+
+
+class GroupAnagrams(CaseMixin, Scene):
+    DEFAULT_CASE: ClassVar[dict] = {"strs": ["eat", "tea", "tan", "ate", "nat", "bat"]}
+
     def construct(self):
         # Title
         title = Text("Group Anagrams Algorithm").scale(0.7).to_edge(UP)
         self.play(Write(title))
 
         # Example input
-        strs = ["eat", "tea", "tan", "ate", "nat", "bat"]
+        strs = self.inputs()["strs"]
 
         ################################################################
         # 1) Display the original input strings across the top of the screen
         ################################################################
-        input_header = Text("Input:", font_size=28).to_edge(LEFT).shift(UP*2)
+        input_header = Text("Input:", font_size=28).to_edge(LEFT).shift(UP * 2)
         self.play(Write(input_header))
 
         # Create a row of Text mobjects for each input string
         input_strings_group = VGroup()
         for i, s in enumerate(strs):
             txt = Text(s, font_size=28)
-            txt.next_to(input_header, RIGHT, buff=1 + i*1.2)
+            txt.next_to(input_header, RIGHT, buff=1 + i * 1.2)
             input_strings_group.add(txt)
 
         self.play(*[Write(obj) for obj in input_strings_group])
@@ -27,7 +34,11 @@ class GroupAnagrams(Scene):
         ################################################################
         # 2) Prepare the dictionary heading: "Dictionary (sorted -> group)"
         ################################################################
-        dict_header = Text("Dictionary (sorted -> group)", font_size=28).to_edge(LEFT).shift(DOWN*0.1)
+        dict_header = (
+            Text("Dictionary (sorted -> group)", font_size=28)
+            .to_edge(LEFT)
+            .shift(DOWN * 0.1)
+        )
         self.play(Write(dict_header))
 
         # We'll keep two structures:
@@ -56,10 +67,9 @@ class GroupAnagrams(Scene):
 
             # "Sorting" demonstration text
             sorted_s = "".join(sorted(s))
-            sorting_text = Text(
-                f"Sorted: {sorted_s}",
-                font_size=24
-            ).next_to(input_strings_group[i], DOWN)
+            sorting_text = Text(f"Sorted: {sorted_s}", font_size=24).next_to(
+                input_strings_group[i], DOWN
+            )
             self.play(Write(sorting_text))
             self.wait(0.6)
             self.play(FadeOut(sorting_text))
@@ -72,7 +82,7 @@ class GroupAnagrams(Scene):
                 # Create new line in the displayed "dictionary"
                 display_str = f"{sorted_s}: [{s}]"
                 new_line = Text(display_str, font_size=26)
-                new_line.move_to([ -2.5, dict_y_offset, 0 ])
+                new_line.move_to([-2.5, dict_y_offset, 0])
                 self.play(Write(new_line))
 
                 # Store reference to this text object
@@ -105,7 +115,9 @@ class GroupAnagrams(Scene):
         ################################################################
         # 4) Final display: Show the combined groups at the bottom
         ################################################################
-        final_groups_header = Text("Final Groups:", font_size=28).to_edge(LEFT).shift(DOWN*3.5)
+        final_groups_header = (
+            Text("Final Groups:", font_size=28).to_edge(LEFT).shift(DOWN * 3.5)
+        )
         self.play(Write(final_groups_header))
 
         # Construct the final list-of-lists from our dict_data
@@ -116,4 +128,4 @@ class GroupAnagrams(Scene):
         self.play(Write(final_groups_text))
 
         # Pause before ending
-        self.wait(2)
\ No newline at end of file
+        self.wait(2)
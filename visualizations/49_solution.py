@@ -1,11 +1,117 @@
-from types import List
+import os
+import struct
+import tempfile
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from string import ascii_lowercase
+
+# From about this length, 26 str.count() calls beat sorting the letters
+COUNT_MIN_LENGTH = 40
+# Bucket files used by group_anagrams_external
+PARTITIONS = 64
+# Length prefix of each word in a bucket file, so words may hold any character
+RECORD_LENGTH = struct.Struct("<I")
+
+
+def signature(word: str):
+    """
+    A key shared by exactly the anagrams of 'word'. Long a-z words use a
+    tuple of letter counts, which is O(k) with no sort. Everything else uses
+    the sorted letters. Anagrams have the same length and letters, so they
+    always get the same kind of key.
+    """
+    if (
+        len(word) >= COUNT_MIN_LENGTH
+        and word.isascii()
+        and word.isalpha()
+        and word.islower()
+    ):
+        return tuple(map(word.count, ascii_lowercase))
+    return "".join(sorted(word))
+
 
 class Solution:
-    def groupAnagrams(self, strs: List[str]) -> List[List[str]]:
+    def groupAnagrams(self, strs: list[str]) -> list[list[str]]:
         groups = defaultdict(list)
         for string in strs:
-            sorted_string = "".join(sorted(string))
-            groups[sorted_string].append(string)
-        
-        return list(groups.values())
\ No newline at end of file
+            groups[signature(string)].append(string)
+
+        return list(groups.values())
+
+
+def shard(word: str, shards: int) -> int:
+    """Shard of 'word'. Its byte sum does not depend on letter order."""
+    return sum(word.encode()) % shards
+
+
+def group_anagrams_parallel(
+    strs: list[str], workers: int | None = None
+) -> list[list[str]]:
+    """
+    groupAnagrams on a process pool. Words are split into one shard per
+    worker so that all anagrams land in the same shard. Each worker groups
+    its shard independently, and the groups are concatenated without being
+    hashed again. Groups come back shard by shard rather than in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return Solution().groupAnagrams(strs)
+
+    shards = [[] for _ in range(workers)]
+    for word in strs:
+        shards[shard(word, workers)].append(word)
+
+    groups = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(Solution().groupAnagrams, shards):
+            groups.extend(part)
+    return groups
+
+
+def iter_words(path) -> Iterator[str]:
+    """Stream the words of a text file with one word per line."""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            yield line.rstrip("\n")
+
+
+def group_anagrams_external(
+    words: Iterable[str], partitions: int = PARTITIONS, directory=None
+) -> Iterator[list[str]]:
+    """
+    groupAnagrams for more words than fit in memory. Words are spilled to
+    'partitions' temporary bucket files in 'directory', with every anagram
+    in the same bucket, and each bucket is then grouped on its own. Groups
+    are yielded as they are found, so peak memory is one bucket.
+    """
+    with tempfile.TemporaryDirectory(dir=directory) as folder:
+        paths = [os.path.join(folder, f"{i}.bin") for i in range(partitions)]
+        with ExitStack() as stack:
+            buckets = [stack.enter_context(open(path, "wb")) for path in paths]
+            for word in words:
+                data = word.encode()
+                # shard(word, partitions), without encoding the word twice
+                bucket = buckets[sum(data) % partitions]
+                bucket.write(RECORD_LENGTH.pack(len(data)))
+                bucket.write(data)
+
+        for path in paths:
+            yield from Solution().groupAnagrams(_read_bucket(path))
+            os.unlink(path)
+
+
+def _read_bucket(path) -> Iterator[str]:
+    """The words of a bucket file written by group_anagrams_external."""
+    with open(path, "rb") as file:
+        while header := file.read(RECORD_LENGTH.size):
+            (length,) = RECORD_LENGTH.unpack(header)
+            yield file.read(length).decode()
+
+
+def group_anagrams_file(
+    path, partitions: int = PARTITIONS, directory=None
+) -> Iterator[list[str]]:
+    """group_anagrams_external over a file with one word per line."""
+    return group_anagrams_external(iter_words(path), partitions, directory)
@@ -1,18 +1,25 @@
 from collections import Counter
+from typing import ClassVar
 
 import numpy as np
 from manim import *
 
+from scene_cases import CaseMixin
+from text_cache import NumberLabel, SetValue, cached_text
+
+
+class Animation771(CaseMixin, Scene):
+    DEFAULT_CASE: ClassVar[dict] = {"jewels": "aA", "stones": "aAAbbbb"}
 
-class Animation771(Scene):
     def construct(self):
         # Title
         title = Text("Jewels and Stones", font_size=36).to_edge(UP)
         self.play(Write(title))
 
         # Input strings
-        jewels_str = "aA"
-        stones_str = "aAAbbbb"
+        case = self.inputs()
+        jewels_str = case["jewels"]
+        stones_str = case["stones"]
 
         # Display input strings
         jewels_text = (
@@ -44,8 +51,10 @@ class Animation771(Scene):
 
         # Create a running count display
         count = 0
+        count_value = NumberLabel(count, font_size=28, edge=LEFT)
         count_text = (
-            Text("Count: 0", font_size=28)
+            VGroup(cached_text("Count:", font_size=28), count_value)
+            .arrange(RIGHT, buff=0.2, aligned_edge=DOWN)
             .next_to(stones_boxes, DOWN, buff=1)
             .align_to(stones_boxes, LEFT)
         )
@@ -70,10 +79,7 @@ class Animation771(Scene):
             self.play(FadeOut(highlight), run_time=0.2)
 
             # Update the count text
-            new_count_text = Text(f"Count: {count}", font_size=28).move_to(
-                count_text.get_center()
-            )
-            self.play(Transform(count_text, new_count_text), run_time=0.3)
+            self.play(SetValue(count_value, count), run_time=0.3)
 
         # Show final result
         result_text = Text(f"Result: {count}", font_size=36, color=GREEN).next_to(
@@ -94,7 +100,7 @@ class Animation771(Scene):
         buff = 1.0
         for i, ch in enumerate(s):
             square = Square(side_length=0.8, color=WHITE)
-            letter_text = Text(ch, font_size=36)
+            letter_text = cached_text(ch, font_size=36)
             group = VGroup(square, letter_text)
             # Center the letter on the square
             letter_text.move_to(square.get_center())
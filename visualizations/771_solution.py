@@ -1,4 +1,98 @@
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import batched, chain
+
+import numpy as np
+
+# From this many stones, Latin-1 input is counted with a NumPy lookup table
+BYTES_MIN_SIZE = 1 << 12
+# Stone strings per task when JewelMatcher.count_many uses a process pool
+CHUNK_STONES = 1 << 16
+# Chunks submitted ahead per worker, which bounds the memory held in tasks
+TASKS_PER_WORKER = 2
+
+
 class Solution:
     def numJewelsInStones(self, jewels: str, stones: str) -> int:
-        jewel_set = set(jewels)
-        return sum(stone in jewel_set for stone in stones)
+        if len(stones) >= BYTES_MIN_SIZE:
+            count = count_jewels_bytes(jewels, stones)
+            if count is not None:
+                return count
+
+        return count_jewels_set(jewels, stones)
+
+
+def count_jewels_set(jewels: str, stones: str) -> int:
+    """numJewelsInStones with a set of the jewels, for any text and length."""
+    jewel_set = set(jewels)
+    return sum(stone in jewel_set for stone in stones)
+
+
+def count_jewels_bytes(jewels: str, stones: str):
+    """
+    numJewelsInStones for Latin-1 text: mark the jewels in a 256-entry table
+    and gather it over the stones' bytes. Returns None for other text.
+    """
+    try:
+        jewel_bytes = jewels.encode("latin-1")
+        stone_bytes = stones.encode("latin-1")
+    except UnicodeEncodeError:
+        return None
+    is_jewel = np.zeros(256, dtype=bool)
+    is_jewel[np.frombuffer(jewel_bytes, dtype=np.uint8)] = True
+    return int(np.count_nonzero(is_jewel[np.frombuffer(stone_bytes, dtype=np.uint8)]))
+
+
+class JewelMatcher:
+    """
+    numJewelsInStones for many stone strings against one jewel set. The
+    jewels are compiled once into a byte deletion table: the jewels in a
+    Latin-1 stone string are the bytes that bytes.translate() removes.
+    Other text counts each jewel with str.count().
+    """
+
+    def __init__(self, jewels: str):
+        self.jewels = "".join(dict.fromkeys(jewels))
+        self.delete = bytes(ord(jewel) for jewel in self.jewels if ord(jewel) < 256)
+
+    def count(self, stones: str) -> int:
+        try:
+            data = stones.encode("latin-1")
+        except UnicodeEncodeError:
+            return sum(map(stones.count, self.jewels))
+        return len(data) - len(data.translate(None, self.delete))
+
+    def count_many(
+        self,
+        stones: Iterable[str],
+        workers: int | None = None,
+        chunk_size: int = CHUNK_STONES,
+    ) -> np.ndarray:
+        """
+        count() for every stone string, in one pass, as an int64 array. With
+        'workers' > 1 the strings are scored in chunks on a process pool, and
+        'stones' is read only as far as the TASKS_PER_WORKER chunks per
+        worker that are in flight.
+        """
+        if workers is None or workers <= 1:
+            return np.fromiter(map(self.count, stones), dtype=np.int64)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = self._count_chunks(
+                executor, batched(stones, chunk_size), workers * TASKS_PER_WORKER
+            )
+            return np.fromiter(chain.from_iterable(parts), dtype=np.int64)
+
+    def _count_chunks(self, executor, chunks, window):
+        """_count_chunk of every chunk in order, at most 'window' at a time."""
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(self._count_chunk, chunk))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def _count_chunk(self, stones):
+        return list(map(self.count, stones))
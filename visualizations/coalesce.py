@@ -0,0 +1,96 @@
+"""
+Fewer, longer plays. Every Scene.play() and Scene.wait() becomes its own
+partial movie file, and pays for scene setup, hashing and an encoder pass,
+so a highlight that is drawn and removed letter by letter costs far more
+than its few seconds of video.
+
+Plays and waits inside 'with self.coalesced():' are buffered instead, and
+the block is played as one Succession when it ends. Each buffered play is a
+step of its own animations that, once the Succession reaches it, adds to the
+scene what Scene.play() would have added, so timing and order do not change.
+Set SCENE_COALESCE=0 to play them one by one, e.g. to compare renders.
+
+Animations in a block are built when play() is called, not when they run,
+so code inside the block must not read state that an earlier buffered play
+is meant to change (such as a mobject's position after a move), nor add a
+new mobject to a group that is already on the scene, as that shows it from
+the start of the block; let the animation that draws it add it instead.
+"""
+
+import os
+from contextlib import contextmanager
+
+from manim import DEFAULT_WAIT_TIME, AnimationGroup, Group, Succession, Wait
+from manim.animation.animation import prepare_animation
+
+COALESCE_ENV = "SCENE_COALESCE"
+
+
+def coalescing_enabled():
+    return os.environ.get(COALESCE_ENV, "1").strip() != "0"
+
+
+class _Step(AnimationGroup):
+    """One buffered play."""
+
+    def _setup_scene(self, scene):
+        # Scene.play() adds the mobjects of non-introducers before they start
+        if scene is not None:
+            scene.add_mobjects_from_animations(self.animations)
+        super()._setup_scene(scene)
+
+
+class CoalescingMixin:
+    """Mixed into a Scene to merge the plays of a block into one."""
+
+    # Buffered steps of the open coalesced() block, None outside of one
+    _steps = None
+
+    @contextmanager
+    def coalesced(self):
+        """Play everything played in this block as one animation."""
+        if self._steps is not None or not coalescing_enabled():
+            # Nested blocks join the outer one
+            yield
+            return
+        self._steps = []
+        try:
+            yield
+        finally:
+            steps, self._steps = self._steps, None
+        if steps:
+            super().play(Succession(*steps, group=self._on_scene_group(steps)))
+
+    def _on_scene_group(self, steps):
+        """
+        The mobjects the steps animate that are on the scene already. Scene.play()
+        adds an animation's group to the scene at its first frame, so a mobject
+        that an earlier step only introduces must not be in it.
+        """
+        on_scene = self.get_mobject_family_members()
+        mobjects = []
+        for step in steps:
+            for animation in getattr(step, "animations", ()):
+                mobject = animation.mobject
+                if (
+                    not animation.is_introducer()
+                    and mobject in on_scene
+                    and mobject not in mobjects
+                ):
+                    mobjects.append(mobject)
+        return Group(*mobjects)
+
+    def play(self, *args, **kwargs):
+        if self._steps is None:
+            return super().play(*args, **kwargs)
+        # What Scene.compile_animations() would do to the arguments
+        animations = [prepare_animation(arg) for arg in args]
+        for animation in animations:
+            for key, value in kwargs.items():
+                setattr(animation, key, value)
+        self._steps.append(_Step(*animations))
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, **kwargs):
+        if self._steps is None:
+            return super().wait(duration, **kwargs)
+        self._steps.append(Wait(run_time=duration))
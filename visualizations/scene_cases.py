@@ -0,0 +1,62 @@
+"""
+Scene inputs. Each scene lists its example input in DEFAULT_CASE and reads
+it with self.inputs(), so the same scene class can render other examples:
+
+    - 'python main.py render <Scene> --cases file.json' renders every case in
+      a case file, and '--input' renders one case given as JSON;
+    - with plain manim, set SCENE_CASE to a JSON object or a case file path:
+      SCENE_CASE='{"cards": [1, 2, 1]}' manim 2260_animation.py
+
+A case file is a JSON or YAML object holding one case, or a list of them.
+Keys missing from a case keep their DEFAULT_CASE value, and the optional
+"name" key names the output file in batch renders.
+"""
+
+import json
+import os
+from collections.abc import Mapping
+from typing import ClassVar
+
+CASE_ENV = "SCENE_CASE"
+
+
+def load_cases(path):
+    """
+    Read a JSON or YAML case file, returning a list of cases. Raises
+    ValueError when a case is not an object.
+    """
+    with open(path) as file:
+        if str(path).endswith((".yaml", ".yml")):
+            import yaml  # Optional, only needed for YAML case files
+
+            cases = yaml.safe_load(file)
+        else:
+            cases = json.load(file)
+    cases = cases if isinstance(cases, list) else [cases]
+    others = [i for i, case in enumerate(cases) if not isinstance(case, Mapping)]
+    if others:
+        raise ValueError(f"{path}: case {others[0]} is not an object")
+    return cases
+
+
+def case_from_env():
+    """The case named by SCENE_CASE, or an empty case when it is not set."""
+    value = os.environ.get(CASE_ENV, "").strip()
+    if not value:
+        return {}
+    if value.startswith("{"):
+        return json.loads(value)
+    return load_cases(value)[0]
+
+
+class CaseMixin:
+    """Mixed into a Scene to give it replaceable example inputs."""
+
+    DEFAULT_CASE: ClassVar[dict] = {}
+    # Set on the scene instance by render.py for batch renders
+    case = None
+
+    def inputs(self):
+        """DEFAULT_CASE updated with the case this render was given."""
+        case = self.case if self.case is not None else case_from_env()
+        return {**self.DEFAULT_CASE, **case}
@@ -0,0 +1,92 @@
+"""
+Cheap Text for labels that change inside the scenes' loops.
+
+Every Text() parses an SVG into glyph outlines, and runs Pango layout too
+unless manim's text_dir already has that string. cached_text() keeps one
+Text per (string, font, size, color) and hands out copies. NumberLabel
+draws a number one cached glyph per character, so a new value only swaps
+the glyphs that changed, and SetValue animates it like Transform(old, new).
+"""
+
+import numpy as np
+from manim import DEFAULT_FONT_SIZE, DOWN, LEFT, ORIGIN, Text, Transform, VGroup
+
+_texts = {}
+
+
+def cached_text(text, font_size=DEFAULT_FONT_SIZE, color=None, font="", **kwargs):
+    """A copy of Text(text, ...), laid out only the first time it is asked for."""
+    key = (text, font, font_size, color, tuple(sorted(kwargs.items())))
+    template = _texts.get(key)
+    if template is None:
+        template = Text(text, font=font, font_size=font_size, color=color, **kwargs)
+        _texts[key] = template
+    return template.copy()
+
+
+class NumberLabel(VGroup):
+    """
+    A number (or any short string, such as "∞") made of one cached glyph per
+    character on a fixed advance, with digits sitting on a shared baseline.
+    It stays centered where it was, or keeps its left edge with edge=LEFT.
+    """
+
+    def __init__(
+        self, value, font_size=DEFAULT_FONT_SIZE, color=None, font="", edge=None
+    ):
+        super().__init__()
+        self.style = {"font_size": font_size, "color": color, "font": font}
+        self.keep_left = edge is not None and np.array_equal(edge, LEFT)
+        digit = cached_text("0", **self.style)
+        self.advance = digit.width * 1.15
+        self.digit_height = digit.height
+        self.string = ""
+        self.glyphs = []
+        self.set_value(value)
+
+    def set_value(self, value):
+        """Show 'value', reusing the glyphs of characters that did not change."""
+        string = str(value)
+        if self.glyphs:
+            anchor = self.get_left() if self.keep_left else self.get_center()
+        else:
+            anchor = ORIGIN
+
+        # Numbers change at the right, so match old and new glyphs from there
+        glyphs = []
+        for i, char in enumerate(string):
+            from_right = len(string) - i
+            if from_right <= len(self.string) and self.string[-from_right] == char:
+                glyphs.append(self.glyphs[-from_right])
+            else:
+                glyphs.append(cached_text(char, **self.style))
+
+        center_y = anchor[1]
+        for i, glyph in enumerate(glyphs):
+            if self.keep_left:
+                x = anchor[0] + (i + 0.5) * self.advance
+            else:
+                x = anchor[0] + (i - (len(glyphs) - 1) / 2) * self.advance
+            glyph.move_to(np.array([x, center_y, 0]))
+            if string[i].isdigit():
+                glyph.align_to(np.array([0, center_y - self.digit_height / 2, 0]), DOWN)
+
+        self.string = string
+        self.glyphs = glyphs
+        self.submobjects = []
+        self.add(*glyphs)
+        return self
+
+
+class SetValue(Transform):
+    """Transform a NumberLabel into its new value, e.g. SetValue(count, 3)."""
+
+    def __init__(self, label, value, **kwargs):
+        self.value = value
+        target = label.copy().set_value(value)
+        super().__init__(label, target, **kwargs)
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        # Transform only moved the points; take the target's glyphs as well
+        self.mobject.set_value(self.value)
@@ -0,0 +1,108 @@
+"""
+Event traces recorded from the solutions and replayed by the scenes.
+
+A solution that supports tracing takes an optional 'tracer' and calls
+tracer.emit(kind, *args) at each step. Every call is guarded by
+'if tracer is not None', so an untraced run only pays those checks, one
+per event a traced run would emit. Event kinds and their arguments:
+
+    call     (method, argument)   a public method was called
+    step     (index,)             step 'index' of a long call starts, e.g. one
+                                  pass of its main loop
+    visit    (key, ...)           an existing element was reached
+    insert   (key,)               a new element was created
+    update   (name, key, value)   name[key] = value, or name = value if key is None
+    compare  (left, right)        two elements were compared
+    result   (value,)             the call returned 'value'
+
+Arguments are plain strings, numbers, booleans or None, so a trace can be
+saved as JSON and replayed without running the algorithm again. A replay
+raises ValueError for an event it does not know how to show.
+"""
+
+import json
+from pathlib import Path
+
+CALL = "call"
+STEP = "step"
+VISIT = "visit"
+INSERT = "insert"
+UPDATE = "update"
+COMPARE = "compare"
+RESULT = "result"
+
+
+class Trace:
+    """A list of (kind, args) events. It is also the tracer that records them."""
+
+    def __init__(self, events=None):
+        self.events = [] if events is None else list(events)
+
+    def emit(self, kind, *args):
+        self.events.append((kind, args))
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+    def calls(self):
+        """Split the trace into one Trace per 'call' event."""
+        calls = []
+        for kind, args in self.events:
+            if kind == CALL or not calls:
+                calls.append(Trace())
+            calls[-1].events.append((kind, args))
+        return calls
+
+    def steps(self):
+        """Split the trace into one Trace per 'call' or 'step' event."""
+        steps = []
+        for kind, args in self.events:
+            if kind in (CALL, STEP) or not steps:
+                steps.append(Trace())
+            steps[-1].events.append((kind, args))
+        return steps
+
+    def sample(self, count):
+        """
+        At most 'count' evenly spaced steps (see steps()), for rendering a long
+        run. The first and the last are always kept, so the trace still starts
+        with its first call and ends with its result.
+        """
+        steps = self.steps()
+        if len(steps) <= count:
+            return Trace(self.events)
+        if count < 2:
+            picked = steps[-count:] if count else []
+        else:
+            gap = (len(steps) - 1) / (count - 1)
+            picked = [steps[round(i * gap)] for i in range(count)]
+        return Trace(event for step in picked for event in step)
+
+    def save(self, path):
+        with open(path, "w") as file:
+            file.writelines(
+                json.dumps([kind, *args]) + "\n" for kind, args in self.events
+            )
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as file:
+            rows = [json.loads(line) for line in file]
+        return cls((row[0], tuple(row[1:])) for row in rows)
+
+    @classmethod
+    def record(cls, run, path=None):
+        """
+        Call run(tracer) and return the trace. With 'path', a trace saved by
+        an earlier run is loaded instead, so the algorithm only runs once.
+        """
+        if path is not None and Path(path).exists():
+            return cls.load(path)
+        trace = cls()
+        run(trace)
+        if path is not None:
+            trace.save(path)
+        return trace